@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 import hashlib
 import os
-from typing import Any, Callable, TypeVar, overload
+from typing import Any, Callable, TypeVar
 
 import logfire
+from ddgs import DDGS
 from opentelemetry import trace
-from pydantic_ai import Agent
-from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool
+from openai import APITimeoutError
+from pydantic import TypeAdapter
+from pydantic_ai import Agent, ModelAPIError, Tool
 from pydantic_ai.messages import ModelMessage
 from pydantic_ai.models.openai import OpenAIChatModel, OpenAIChatModelSettings
 from pydantic_ai.providers.openai import OpenAIProvider
+from typing_extensions import TypedDict  # pydantic needs this TypedDict before Python 3.12
 
+from leads_agent.common import truncate
 from leads_agent.config import Settings
-from leads_agent.models import EnrichedLeadClassification, HubSpotLead, LeadClassification
+from leads_agent.models import EnrichedLeadClassification, HubSpotLead, LeadClassification, LeadLabel
 from leads_agent.prompts import get_prompt_manager
 
 # Configure logfire only if token is available
@@ -40,14 +50,31 @@ def _logfire_span(name: str, **kwargs):
 
 TOutput = TypeVar("TOutput")
 
+# In-process LRU of final classifications keyed by everything that determines them, so
+# duplicate leads (webhook retries, replays, re-running a backtest) skip the LLM entirely.
+# Any mapping with get/set semantics (e.g. a Redis-backed one) could stand in for it.
+_CLASSIFY_CACHE_SIZE = 1024
+_classify_cache: OrderedDict[bytes, LeadClassification | EnrichedLeadClassification] = OrderedDict()
+_classify_cache_lock = threading.Lock()
 
-@dataclass
+# Fast-model triage results below this confidence are re-run on the main model
+_FAST_TRIAGE_MIN_CONFIDENCE = 0.7
+
+# Per-request LLM timeout (seconds), so a hung provider connection can't stall a run.
+# The OpenAI client retries timed-out requests (openai.DEFAULT_MAX_RETRIES, 2), so one
+# agent call can take up to 30 s x 3 attempts (plus backoff) before it gives up.
+_LLM_REQUEST_TIMEOUT = 30.0
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of classification with optional debug info."""
 
     classification: LeadClassification | EnrichedLeadClassification
     message_history: list[ModelMessage] = field(default_factory=list)
     usage: dict[str, Any] = field(default_factory=dict)
+    # True when triage timed out: `classification` is a placeholder, not a verdict
+    timed_out: bool = False
 
     @property
     def label(self) -> str:
@@ -73,8 +100,8 @@ class ClassificationResult:
                     part_type = type(part).__name__
                     if hasattr(part, "content"):
                         content = part.content
-                        if not verbose and len(str(content)) > 200:
-                            content = str(content)[:200] + "..."
+                        if not verbose:
+                            content = truncate(str(content), 200)
                         lines.append(f"  └─ {part_type}: {content}")
                     elif hasattr(part, "tool_name"):
                         lines.append(f"  └─ {part_type}: {part.tool_name}({getattr(part, 'args', {})})")
@@ -99,18 +126,34 @@ class ClassificationResult:
         print("=" * 60 + "\n")
 
 
-@overload
-def agent_factory(
-    *,
-    llm_base_url: str,
-    llm_model_name: str,
-    llm_api_key: str = "ollama",
-    instructions: str | None = None,
-    output_type: type[TOutput],
-    model_settings: OpenAIChatModelSettings,
-    extra_tools: tuple[Callable, ...] | None = None,
-    use_duckduckgo_search: bool = False,
-) -> Agent[None, TOutput]: ...
+def _per_thread_cache(fn: Callable[..., TOutput]) -> Callable[..., TOutput]:
+    """
+    Memoize `fn` by positional args, with a separate cache per thread.
+
+    Providers (and the agents holding them) are shared per thread: each sync
+    classify_lead() runs its own event loop, and an async HTTP client must not
+    be used from two loops at once.
+    """
+    local = threading.local()
+
+    @wraps(fn)
+    def wrapper(*args: Any) -> TOutput:
+        cache = getattr(local, "cache", None)
+        if cache is None:
+            cache = local.cache = {}
+        try:
+            return cache[args]
+        except KeyError:
+            value = cache[args] = fn(*args)
+            return value
+
+    return wrapper
+
+
+@_per_thread_cache
+def _shared_provider(base_url: str, api_key: str) -> OpenAIProvider:
+    """Return this thread's OpenAIProvider for (base_url, api_key), creating it once."""
+    return OpenAIProvider(base_url=base_url, api_key=api_key)
 
 
 def agent_factory(
@@ -127,12 +170,12 @@ def agent_factory(
     """
     Create an agent in a consistent way across triage/research/scoring.
     """
-    provider = OpenAIProvider(base_url=llm_base_url, api_key=llm_api_key)
+    provider = _shared_provider(llm_base_url, llm_api_key)
     model = OpenAIChatModel(model_name=llm_model_name, provider=provider)
 
-    tools: list[Any] = list(extra_tools) if extra_tools else []
+    tools: tuple[Any, ...] = extra_tools or ()
     if use_duckduckgo_search:
-        tools.append(duckduckgo_search_tool())
+        tools = (*tools, Tool(_cached_duckduckgo_search, name="duckduckgo_search"))
 
     return Agent(
         model=model,
@@ -140,7 +183,7 @@ def agent_factory(
         instructions=instructions or "",
         retries=2,
         end_strategy="early",
-        model_settings=model_settings,
+        model_settings={"timeout": _LLM_REQUEST_TIMEOUT, **model_settings},
         tools=tools,
     )
 
@@ -158,59 +201,281 @@ def _usage_snapshot(result: Any) -> dict[str, Any]:
     }
 
 
-def _create_triage_agent(settings: Settings, api_key: str) -> Agent[None, LeadClassification]:
-    pm = get_prompt_manager()
+@_per_thread_cache
+def _create_triage_agent(
+    llm_base_url: str, llm_model_name: str, llm_api_key: str, instructions: str
+) -> Agent[None, LeadClassification]:
     return agent_factory(
-        llm_base_url=settings.llm_base_url,
-        llm_model_name=settings.llm_model_name,
-        llm_api_key=api_key,
-        instructions=pm.build_triage_prompt(),
+        llm_base_url=llm_base_url,
+        llm_model_name=llm_model_name,
+        llm_api_key=llm_api_key,
+        instructions=instructions,
         output_type=LeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=900),
+        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=512),
     )
 
 
-def _create_research_agent(settings: Settings, api_key: str) -> Agent[None, EnrichedLeadClassification]:
-    pm = get_prompt_manager()
+@_per_thread_cache
+def _create_research_agent(
+    llm_base_url: str, llm_model_name: str, llm_api_key: str, instructions: str, use_search: bool
+) -> Agent[None, EnrichedLeadClassification]:
     return agent_factory(
-        llm_base_url=settings.llm_base_url,
-        llm_model_name=settings.llm_model_name,
-        llm_api_key=api_key,
-        instructions=pm.build_research_prompt(),
+        llm_base_url=llm_base_url,
+        llm_model_name=llm_model_name,
+        llm_api_key=llm_api_key,
+        instructions=instructions,
         output_type=EnrichedLeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=8000),
-        use_duckduckgo_search=True,
+        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=1536),
+        use_duckduckgo_search=use_search,
     )
 
 
-def _create_scoring_agent(settings: Settings, api_key: str) -> Agent[None, EnrichedLeadClassification]:
-    pm = get_prompt_manager()
+class DuckDuckGoResult(TypedDict):
+    """A DuckDuckGo search result."""
+
+    title: str
+    href: str
+    body: str
+
+
+_ddg_results = TypeAdapter(list[DuckDuckGoResult])
+
+
+@lru_cache(maxsize=1)
+def _ddgs_client() -> DDGS:
+    """Process-wide DuckDuckGo client, shared by prefetch searches and the research tool."""
+    return DDGS()
+
+
+# DuckDuckGo rate-limits aggressively, and leads from the same company repeat the same
+# queries, so successful results are kept in-process for a day. Failures aren't cached.
+_DDG_CACHE_SIZE = 2048
+_DDG_CACHE_TTL = 24 * 60 * 60
+_ddg_cache: OrderedDict[tuple[str, int | None], tuple[float, list[DuckDuckGoResult]]] = OrderedDict()
+_ddg_cache_lock = threading.Lock()
+
+
+async def _ddg_search(query: str, max_results: int | None = None) -> list[DuckDuckGoResult]:
+    """DuckDuckGo text search through the TTL cache."""
+    key = (query, max_results)
+    now = time.monotonic()
+    with _ddg_cache_lock:
+        hit = _ddg_cache.get(key)
+        if hit is not None and now - hit[0] < _DDG_CACHE_TTL:
+            _ddg_cache.move_to_end(key)
+            return hit[1]
+
+    # ddgs is synchronous; run it off the event loop
+    raw = await asyncio.to_thread(_ddgs_client().text, query, max_results=max_results)
+    results = _ddg_results.validate_python(raw)
+
+    with _ddg_cache_lock:
+        _ddg_cache[key] = (now, results)
+        _ddg_cache.move_to_end(key)
+        if len(_ddg_cache) > _DDG_CACHE_SIZE:
+            _ddg_cache.popitem(last=False)
+    return results
+
+
+async def _cached_duckduckgo_search(query: str) -> list[DuckDuckGoResult]:
+    """Searches DuckDuckGo for the given query and returns the results.
+
+    Args:
+        query: The query to search for.
+    """
+    return await _ddg_search(query)
+
+
+# Webmail domains say nothing about the lead's company, so they're never searched
+_FREEMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "yahoo.com",
+        "hotmail.com",
+        "outlook.com",
+        "live.com",
+        "icloud.com",
+        "aol.com",
+        "proton.me",
+        "protonmail.com",
+    }
+)
+
+
+def _research_queries(company: str, contact_name: str, email_domain: str) -> list[str]:
+    """The core research searches (domain, company, contact), built from lead data alone."""
+    if email_domain.lower() in _FREEMAIL_DOMAINS:
+        if company == email_domain:
+            company = ""
+        email_domain = ""
+    queries = []
+    if email_domain:
+        queries.append(f"site:{email_domain} (about OR company OR product OR pricing) -login -pdf")
+    if company and company != email_domain:
+        queries.append(f'"{company}" (pricing OR customers OR case study OR industries) -jobs -careers')
+    if contact_name:
+        org = f' "{company}"' if company else ""
+        queries.append(f'"{contact_name}"{org} (LinkedIn OR title OR VP OR Head OR Director)')
+    return queries
+
+
+async def _prefetch_searches(queries: list[str], max_results: int = 3) -> str:
+    """Run the core searches concurrently and format the top results as prompt context."""
+    results = await asyncio.gather(*(_ddg_search(q, max_results) for q in queries), return_exceptions=True)
+
+    sections = []
+    for query, hits in zip(queries, results):
+        if isinstance(hits, BaseException):
+            sections.append(f"Query: {query}\n  (search failed: {hits})")
+            continue
+        lines = [f"Query: {query}"]
+        lines.extend(f"- {h['title']} ({h['href']})\n  {truncate(h['body'], 300)}" for h in hits)
+        if not hits:
+            lines.append("  (no results)")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+@_per_thread_cache
+def _create_scoring_agent(
+    llm_base_url: str, llm_model_name: str, llm_api_key: str, instructions: str
+) -> Agent[None, EnrichedLeadClassification]:
     return agent_factory(
-        llm_base_url=settings.llm_base_url,
-        llm_model_name=settings.llm_model_name,
-        llm_api_key=api_key,
-        instructions=pm.build_scoring_prompt(),
+        llm_base_url=llm_base_url,
+        llm_model_name=llm_model_name,
+        llm_api_key=llm_api_key,
+        instructions=instructions,
         output_type=EnrichedLeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=2500),
+        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=1536),
     )
 
 
+# Blatant spam pitches that never need an LLM call, by rule name. Deliberately narrow:
+# anything ambiguous still goes through triage. Only the rules a deployment enables in
+# PromptConfig.spam_rules are applied.
+_SPAM_RULES = {
+    "seo": re.compile(
+        r"\b(?:guest\s+posts?|backlinks?|link[\s-]+building|seo\s+(?:services|package|agency))\b", re.IGNORECASE
+    ),
+    "crypto": re.compile(
+        r"\b(?:crypto(?:currency)?\s+(?:investment|trading|signals)|forex\s+(?:trading|signals)|bitcoin\s+investment)\b",
+        re.IGNORECASE,
+    ),
+}
+
+
+def _prefilter(lead: HubSpotLead) -> LeadClassification | None:
+    """Rule-based triage for obvious spam; returns None when the LLM should decide."""
+    enabled = get_prompt_manager().config.spam_rules
+    if not enabled:
+        return None
+    text = lead.message or lead.raw_text
+    if not text:
+        return None
+    for name, pattern in _SPAM_RULES.items():
+        if name in enabled and pattern.search(text):
+            return LeadClassification(
+                first_name=lead.first_name,
+                last_name=lead.last_name,
+                email=lead.email,
+                company=lead.company,
+                label=LeadLabel.ignore,
+                confidence=0.99,
+                reason=f"rule:{name}",
+            )
+    return None
+
+
+def _is_timeout(exc: ModelAPIError) -> bool:
+    """True if a model API error was caused by the request timing out."""
+    return isinstance(exc.__cause__, APITimeoutError)
+
+
+async def _run_triage(
+    agent: Agent[None, LeadClassification],
+    prompt: str,
+    on_partial: Callable[[LeadClassification], None] | None,
+) -> tuple[Any, LeadClassification]:
+    """Run a triage agent, streaming partial output to `on_partial` when given."""
+    if on_partial is None:
+        run = await agent.run(prompt)
+        return run, run.output
+    # Stream triage so callers can show the decision while it's still being generated
+    async with agent.run_stream(prompt) as run:
+        async for partial in run.stream_output():
+            on_partial(partial)
+        return run, await run.get_output()
+
+
+def _classify_cache_key(settings: Settings, prompt_text: str, max_searches: int) -> bytes:
+    """SHA-256 over model, prompt config, lead prompt text and search budget."""
+    h = hashlib.sha256()
+    for part in (
+        settings.llm_base_url,
+        settings.llm_model_name,
+        settings.llm_model_name_fast or "",
+        get_prompt_manager().config.model_dump_json(),
+        prompt_text,
+        str(max_searches),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.digest()
+
+
 def classify_lead(
     settings: Settings,
     lead: HubSpotLead,
     *,
     debug: bool = False,
     max_searches: int = 4,
-) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
+    on_partial: Callable[[LeadClassification], None] | None = None,
+) -> ClassificationResult:
     """
     Classify a HubSpot lead using a multi-stage pipeline:
     triage → (if promising) web research → (if promising) final 1–5 scoring.
+
+    Always returns a ClassificationResult; message history and token usage are
+    only populated when `debug` is set. If `on_partial` is given, the triage stage
+    is streamed and it's called with each partially-generated classification.
+    Synchronous wrapper around classify_lead_async().
+    """
+    return asyncio.run(
+        classify_lead_async(settings, lead, debug=debug, max_searches=max_searches, on_partial=on_partial)
+    )
+
+
+async def classify_lead_async(
+    settings: Settings,
+    lead: HubSpotLead,
+    *,
+    debug: bool = False,
+    max_searches: int = 4,
+    on_partial: Callable[[LeadClassification], None] | None = None,
+) -> ClassificationResult:
+    """
+    Async version of classify_lead(); LLM calls are awaited so many leads can overlap.
+
+    Non-debug results are cached in-process (see _classify_cache), keyed by model,
+    prompt config, lead content and `max_searches`.
     """
+    # Built once: it's both the triage prompt and part of the cache key
+    prompt = lead.to_prompt_text()
+    cache_key = None
+    if not debug:
+        cache_key = _classify_cache_key(settings, prompt, max_searches)
+        with _classify_cache_lock:
+            cached = _classify_cache.get(cache_key)
+            if cached is not None:
+                _classify_cache.move_to_end(cache_key)
+                return ClassificationResult(classification=cached)
+
     # Ensure there is a stable parent span even when classify_lead is called directly
     # (e.g., CLI/backtest). When invoked under an existing span (e.g., Slack processing),
     # we create a child span instead.
-    current = trace.get_current_span()
-    has_parent = current.get_span_context().is_valid
+    # Span names only matter when logfire is on; skip the OTel context lookup otherwise
+    has_parent = _logfire_enabled and trace.get_current_span().get_span_context().is_valid
 
     lead_id = ""
     if lead.email:
@@ -234,69 +499,133 @@ def classify_lead(
         company=lead.company,
         max_searches=max_searches,
     ):
-        api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else "ollama"
-
-        triage_agent = _create_triage_agent(settings, api_key)
-        prompt = lead.to_prompt_text()
-        triage_run = triage_agent.run_sync(prompt)
-        triage = triage_run.output
+        ruled = _prefilter(lead)
+        if ruled is not None:
+            return ClassificationResult(classification=ruled)
 
-        final: LeadClassification | EnrichedLeadClassification = triage
-        message_history: list[ModelMessage] = []
-        usage: dict[str, Any] = {"triage": _usage_snapshot(triage_run)}
-        try:
-            message_history.extend(triage_run.all_messages())
-        except Exception:
-            pass
+        api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else "ollama"
 
-        if triage.label.value == "promising":
-            enriched, research_msgs, research_usage = _research_lead(
-                settings, lead, triage, max_searches=max_searches, return_debug=True
-            )
-            if research_msgs:
-                message_history.extend(research_msgs)
-            if research_usage:
-                usage["research"] = research_usage
-
-            scored, scoring_msgs, scoring_usage = _score_lead(
-                settings,
-                lead,
-                triage=triage,
-                enriched=enriched,
-                return_debug=True,
-            )
-            final = scored
-            if scoring_msgs:
-                message_history.extend(scoring_msgs)
-            if scoring_usage:
-                usage["scoring"] = scoring_usage
-
-        if debug:
-            return ClassificationResult(
-                classification=final,
-                message_history=message_history,
-                usage=usage,
-            )
-        return final
+        # One provider (and HTTP connection pool) for all stages of this lead; closed
+        # on exit so the next event loop (asyncio.run) gets a fresh client.
+        async with _shared_provider(settings.llm_base_url, api_key):
+            message_history: list[ModelMessage] = []
+            usage: dict[str, Any] = {}
+            timed_out = False
+            try:
+                triage_prompt = get_prompt_manager().build_triage_prompt()
+                fast_model = settings.llm_model_name_fast
+
+                # With a fast model configured, it triages first; only low-confidence or promising
+                # leads are re-triaged by the main (strong) model.
+                triage_agent = _create_triage_agent(
+                    settings.llm_base_url, fast_model or settings.llm_model_name, api_key, triage_prompt
+                )
+                triage_run, triage = await _run_triage(triage_agent, prompt, on_partial)
+                if fast_model and (
+                    triage.confidence < _FAST_TRIAGE_MIN_CONFIDENCE or triage.label.value == "promising"
+                ):
+                    if debug:
+                        usage["triage_fast"] = _usage_snapshot(triage_run)
+                        message_history.extend(triage_run.all_messages())
+                    triage_agent = _create_triage_agent(
+                        settings.llm_base_url, settings.llm_model_name, api_key, triage_prompt
+                    )
+                    triage_run, triage = await _run_triage(triage_agent, prompt, on_partial)
+                if debug:
+                    usage["triage"] = _usage_snapshot(triage_run)
+                    try:
+                        message_history.extend(triage_run.all_messages())
+                    except Exception:
+                        pass
+            except ModelAPIError as e:
+                if not _is_timeout(e):
+                    raise
+                # Don't let one hung request stall the run; leave the lead for a rerun
+                cache_key = None
+                timed_out = True
+                triage = LeadClassification(
+                    label=LeadLabel.ignore, confidence=0.0, reason="Not classified: LLM request timed out"
+                )
+
+            final: LeadClassification | EnrichedLeadClassification = triage
+
+            if triage.label.value == "promising":
+                enriched, research_msgs, research_usage = await _research_lead(
+                    settings, lead, triage, max_searches=max_searches, return_debug=True
+                )
+                if "error" in research_usage:
+                    cache_key = None  # don't pin a transient research failure
+                if debug:
+                    message_history.extend(research_msgs or ())
+                    if research_usage:
+                        usage["research"] = research_usage
+
+                try:
+                    scored, scoring_msgs, scoring_usage = await _score_lead(
+                        settings,
+                        lead,
+                        triage=triage,
+                        enriched=enriched,
+                        return_debug=True,
+                    )
+                except ModelAPIError as e:
+                    if not _is_timeout(e):
+                        raise
+                    # Keep the research without a score rather than failing the lead
+                    cache_key = None
+                    scored, scoring_msgs, scoring_usage = enriched, [], {"error": str(e)}
+                final = scored
+                if debug:
+                    message_history.extend(scoring_msgs or ())
+                    if scoring_usage:
+                        usage["scoring"] = scoring_usage
+
+        if cache_key is not None:
+            with _classify_cache_lock:
+                _classify_cache[cache_key] = final
+                if len(_classify_cache) > _CLASSIFY_CACHE_SIZE:
+                    _classify_cache.popitem(last=False)
+
+        return ClassificationResult(
+            classification=final,
+            message_history=message_history,
+            usage=usage,
+            timed_out=timed_out,
+        )
 
 
-def _research_lead(
+async def _research_lead(
     settings: Settings,
     lead: HubSpotLead,
     classification: LeadClassification,
     max_searches: int = 4,
     return_debug: bool = False,
 ) -> EnrichedLeadClassification | tuple[EnrichedLeadClassification, list[ModelMessage], dict[str, Any]]:
-    api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else "ollama"
-    research_agent = _create_research_agent(settings, api_key)
-
-    email_domain = ""
-    if lead.email and "@" in lead.email:
-        email_domain = lead.email.split("@")[1]
-
+    email_domain = lead.email_domain
     company = classification.company or lead.company or email_domain
-    contact_name = f"{lead.first_name or ''} {lead.last_name or ''}".strip()
+    contact_name = lead.full_name
+
+    # The core searches don't depend on the model's reasoning, so run them up front in
+    # parallel; the search tool is only offered for follow-ups within the remaining budget.
+    queries = _research_queries(company, contact_name, email_domain)[:max_searches]
+    follow_ups = max_searches - len(queries)
+    search_results = await _prefetch_searches(queries) if queries else "(no searches run)"
+    if follow_ups > 0:
+        search_budget = f"You may run up to {follow_ups} follow-up searches if these results are insufficient."
+    else:
+        search_budget = "No further searches are available; work from these results."
+
+    api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else "ollama"
+    research_agent = _create_research_agent(
+        settings.llm_base_url,
+        settings.llm_model_name,
+        api_key,
+        get_prompt_manager().build_research_prompt(),
+        follow_ups > 0,
+    )
 
+    # Only per-lead data goes in the user message; the search strategy and query rules live in the
+    # (byte-stable) system prompt so providers with prefix caching can reuse it across leads.
     research_prompt = f"""
 Research this promising lead:
 
@@ -316,22 +645,15 @@ Triage classification:
 - Confidence: {classification.confidence:.0%}
 - Reason: {classification.reason}
 
-Research plan:
-1) If an email domain is present ({email_domain or "N/A"}), search it to identify the official website and company name.
-2) Search the company name to understand what they do (quick description, industry, size if available).
-3) Search "{contact_name} {company}" to find role/title (if name/company are available).
+Search results:
+{search_results}
 
-Query quality requirements:
-- Use DuckDuckGo operators where helpful (quotes, site:, exclusions like -jobs -careers, and small OR groups).
-- Use the "Query Operator Clause Pack" provided in your system prompt to add ICP/focus-area qualifiers.
-- Before each tool call, draft 2–3 candidate queries, then pick the best one.
-
-Limit yourself to {max_searches} total searches.
+{search_budget}
 Return an enriched classification with your research findings.
 """
 
     try:
-        run = research_agent.run_sync(research_prompt)
+        run = await research_agent.run(research_prompt)
         output = run.output
         if return_debug:
             return output, run.all_messages(), _usage_snapshot(run)
@@ -354,7 +676,7 @@ Return an enriched classification with your research findings.
         return fallback
 
 
-def _score_lead(
+async def _score_lead(
     settings: Settings,
     lead: HubSpotLead,
     *,
@@ -363,12 +685,12 @@ def _score_lead(
     return_debug: bool = False,
 ) -> EnrichedLeadClassification | tuple[EnrichedLeadClassification, list[ModelMessage], dict[str, Any]]:
     api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else "ollama"
-    scoring_agent = _create_scoring_agent(settings, api_key)
+    scoring_agent = _create_scoring_agent(
+        settings.llm_base_url, settings.llm_model_name, api_key, get_prompt_manager().build_scoring_prompt()
+    )
 
-    name = f"{lead.first_name or ''} {lead.last_name or ''}".strip()
-    email_domain = ""
-    if lead.email and "@" in lead.email:
-        email_domain = lead.email.split("@")[1]
+    name = lead.full_name
+    email_domain = lead.email_domain
 
     scoring_input = f"""
 Lead:
@@ -389,7 +711,7 @@ Research output (if any):
 {enriched.model_dump_json(indent=2, exclude_none=True) if enriched is not None else "None"}
 """
 
-    run = scoring_agent.run_sync(scoring_input)
+    run = await scoring_agent.run(scoring_input)
     output = run.output
     if return_debug:
         return output, run.all_messages(), _usage_snapshot(run)
@@ -402,8 +724,9 @@ def classify_message(
     *,
     debug: bool = False,
     max_searches: int = 4,
-) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
+    on_partial: Callable[[LeadClassification], None] | None = None,
+) -> ClassificationResult:
     """Classify a raw message text using the same pipeline as classify_lead()."""
     lead = HubSpotLead(raw_text=text, message=text)
-    return classify_lead(settings, lead, debug=debug, max_searches=max_searches)
+    return classify_lead(settings, lead, debug=debug, max_searches=max_searches, on_partial=on_partial)
 
@@ -115,9 +115,13 @@ def create_bolt_app(settings: Settings | None = None) -> App:
                 lead,
                 channel_id=channel,
                 thread_ts=event["ts"],
+                client=client,
             )
 
-            logger.info(f"Classified: {result.label} ({result.classification.confidence:.0%})")
+            if result.timed_out:
+                logger.warning("Not classified: LLM request timed out")
+            else:
+                logger.info(f"Classified: {result.label} ({result.classification.confidence:.0%})")
 
     @app.event({"type": "message", "subtype": "message_changed"})
     def handle_message_changed(event: dict):
@@ -206,9 +210,13 @@ def run_test_mode(
                 thread_ts=None,  # Not as a thread reply
                 max_searches=max_searches,
                 include_lead_info=True,  # Include lead details
+                client=client,
             )
 
-            logger.info(f"Classified: {result.label} ({result.classification.confidence:.0%})")
+            if result.timed_out:
+                logger.warning("Not classified: LLM request timed out")
+            else:
+                logger.info(f"Classified: {result.label} ({result.classification.confidence:.0%})")
             if not settings.dry_run:
                 logger.info(f"Posted to test channel: {target_channel}")
 
@@ -237,13 +245,14 @@ def run_test_mode(
 def collect_events(
     settings: Settings | None = None,
     keep: int = 20,
-    output_file: str = "collected_events.json",
+    output_file: str = "collected_events.jsonl",
 ) -> None:
     """
     Collect raw Socket Mode events for debugging/inspection.
 
-    Saves the complete raw payload for each event to a JSON file.
-    Stops after collecting `keep` events or on Ctrl+C.
+    Appends the complete raw payload for each event to a JSON Lines file
+    (one event per line) as it arrives. Stops after collecting `keep`
+    events or on Ctrl+C.
     """
     import json
     import threading
@@ -257,23 +266,24 @@ def collect_events(
     settings = settings or get_settings()
     settings.require_slack_socket_mode()
 
-    collected: list[dict] = []
+    collected = 0
     lock = threading.Lock()
     should_stop = threading.Event()
 
     def save_events():
-        """Save collected events to file (thread-safe)."""
+        """Flush appended events to disk (thread-safe)."""
         with lock:
-            if not collected:
+            if not collected or out.closed:
                 return
             try:
-                Path(output_file).write_text(json.dumps(collected, indent=2, default=str))
-                print(f"\n[SAVED] {len(collected)} events to {output_file}")
+                out.flush()
+                print(f"\n[SAVED] {collected} events to {output_file}")
             except Exception as e:
                 print(f"\n[ERROR] Failed to save events: {e}")
 
     def handle_socket_mode_request(client: SocketModeClient, req: SocketModeRequest):
         """Capture every raw Socket Mode request."""
+        nonlocal collected
         try:
             # Acknowledge immediately
             client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
@@ -291,9 +301,11 @@ def collect_events(
                 } if hasattr(req, "retry_num") else None,
             }
 
+            line = json.dumps(event_data, default=str) + "\n"
             with lock:
-                collected.append(event_data)
-                count = len(collected)
+                out.write(line)
+                collected += 1
+                count = collected
                 
             # Log with more detail
             event_type = req.type
@@ -333,35 +345,38 @@ def collect_events(
     print("\n[COLLECT] Listening for raw Socket Mode events")
     print(f"  Target: {keep} events")
     print(f"  Output: {output_file}")
-    print(f"  Auto-save: Every 5 events")
+    print(f"  Auto-save: Every 5 events (JSON Lines)")
     print("\nWaiting for events... (Ctrl+C to stop early)\n")
 
-    try:
-        client.connect()
-        # Wait until we should stop (either target reached or interrupted)
-        while not should_stop.is_set():
-            sleep(0.5)
-            # Check connection health
-            if not client.is_connected():
-                print("\n[WARNING] Socket Mode connection lost. Reconnecting...")
-                try:
-                    client.connect()
-                except Exception as e:
-                    print(f"[ERROR] Failed to reconnect: {e}")
-                    break
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Saving collected events...")
-        save_events()
-        print("\n[INTERRUPTED] Saved partial collection.")
-    except Exception as e:
-        print(f"\n[ERROR] Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        save_events()
-    finally:
-        # Final save to ensure nothing is lost
-        save_events()
+    # Opened only once the client is set up, so a setup failure leaves the old file intact
+    with Path(output_file).open("w", encoding="utf-8") as out:
         try:
-            client.close()
-        except Exception:
-            pass
+            client.connect()
+            # Wait until we should stop (either target reached or interrupted)
+            while not should_stop.is_set():
+                sleep(0.5)
+                # Check connection health
+                if not client.is_connected():
+                    print("\n[WARNING] Socket Mode connection lost. Reconnecting...")
+                    try:
+                        client.connect()
+                    except Exception as e:
+                        print(f"[ERROR] Failed to reconnect: {e}")
+                        break
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Saving collected events...")
+            save_events()
+            print("\n[INTERRUPTED] Saved partial collection.")
+        except Exception as e:
+            print(f"\n[ERROR] Unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+            save_events()
+        finally:
+            # Stop event delivery before the final save; the file closes after it
+            try:
+                client.close()
+            except Exception:
+                pass
+            # Final save to ensure nothing is lost
+            save_events()
@@ -1,24 +1,39 @@
-import json
+from functools import wraps
 from pathlib import Path
 
 import typer
 from rich import print as rprint
-from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.syntax import Syntax
-from rich.table import Table
 
-from leads_agent.config import get_settings
-from leads_agent.prompts import get_prompt_manager
+from leads_agent.common import LeadsAgentExit
 
-app = typer.Typer(
+
+class _Typer(typer.Typer):
+    """Typer app whose commands map LeadsAgentExit to typer.Exit (command modules stay typer-free)."""
+
+    def command(self, *args, **kwargs):
+        register = super().command(*args, **kwargs)
+
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*f_args, **f_kwargs):
+                try:
+                    return f(*f_args, **f_kwargs)
+                except LeadsAgentExit as e:
+                    raise typer.Exit(e.code) from None
+
+            register(wrapper)
+            return f
+
+        return decorator
+
+
+app = _Typer(
     name="leads-agent",
     help="🧠 AI-powered Slack lead classifier",
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
 
 
 @app.command(name="init")
@@ -70,7 +85,7 @@ def run_command():
 @app.command()
 def collect(
     keep: int = typer.Option(20, "--keep", "-n", help="Number of events to collect"),
-    output: str = typer.Option("collected_events.json", "--output", "-o", help="Output JSON file"),
+    output: str = typer.Option("collected_events.jsonl", "--output", "-o", help="Output JSON Lines file"),
 ):
     """
     Collect raw Socket Mode events for debugging.
@@ -86,7 +101,7 @@ def collect(
 
 @app.command(name="backtest")
 def backtest_command(
-    events_file: Path = typer.Argument(..., help="JSON file with collected events (from `collect` command)"),
+    events_file: Path = typer.Argument(..., help="JSON Lines/JSON file with collected events (from `collect` command)"),
     limit: int = typer.Option(None, "--limit", "-n", help="Max number of leads to process"),
     max_searches: int = typer.Option(4, "--max-searches", help="Max web searches per lead"),
     debug: bool = typer.Option(False, "--debug", "-d", help="Show agent steps and token usage"),
@@ -96,7 +111,7 @@ def backtest_command(
     Run classifier on collected events (console output only).
 
     First collect events with: leads-agent collect --keep 20
-    Then backtest with: leads-agent backtest collected_events.json
+    Then backtest with: leads-agent backtest collected_events.jsonl
     """
     from leads_agent.core import run_backtest
 
@@ -125,12 +140,13 @@ def test(
     Respects DRY_RUN config setting. Use --dry-run or --live to override.
     """
     from leads_agent.app import run_test_mode
+    from leads_agent.config import get_settings
 
     settings = get_settings()
 
     # Override dry_run if explicitly set
     if dry_run is not None:
-        settings.dry_run = dry_run
+        settings = settings.model_copy(update={"dry_run": dry_run})
 
     # Determine test channel
     target_channel = test_channel or settings.slack_test_channel_id
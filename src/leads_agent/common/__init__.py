@@ -1,5 +1,9 @@
+from leads_agent.common.errors import LeadsAgentExit
 from leads_agent.common.mask import mask_secret
+from leads_agent.common.text import truncate
 
 __all__ = [
+    "LeadsAgentExit",
     "mask_secret",
+    "truncate",
 ]
\ No newline at end of file
@@ -0,0 +1,6 @@
+class LeadsAgentExit(Exception):
+    """Raised by command implementations to stop with an exit code (the CLI maps it to typer.Exit)."""
+
+    def __init__(self, code: int = 1):
+        super().__init__(code)
+        self.code = code
@@ -0,0 +1,3 @@
+def truncate(text: str, limit: int) -> str:
+    """Cut text to `limit` characters, appending "..." only when it was shortened."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
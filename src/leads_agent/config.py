@@ -1,34 +1,61 @@
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import get_args
 
 
 from rich import print as rprint
 from rich.console import Console
 from rich.table import Table
-import typer
+from dotenv import dotenv_values
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from leads_agent.common import mask_secret
+from leads_agent.common import LeadsAgentExit, mask_secret
 
 console = Console()
 
 
 def _find_dotenv() -> Path | None:
-    """Search for .env file from cwd upward to find project root."""
+    """
+    Search for .env file from cwd upward to find project root.
+
+    Set LEADS_AGENT_DOTENV to an explicit path to skip the search.
+    """
+    override = os.environ.get("LEADS_AGENT_DOTENV")
+    if override:
+        return Path(override)
+
     current = Path.cwd()
     for parent in [current, *current.parents]:
-        candidate = parent / ".env"
-        if candidate.is_file():
-            return candidate
+        # One directory listing per level instead of a stat() per marker
+        has_env = is_root = False
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name == ".env":
+                        has_env = entry.is_file()
+                    elif entry.name == "pyproject.toml":
+                        is_root = is_root or entry.is_file()
+                    elif entry.name == ".git":
+                        is_root = is_root or entry.is_dir()
+        except OSError:
+            continue
+        if has_env:
+            return parent / ".env"
         # Stop at common project root indicators
-        if (parent / "pyproject.toml").is_file() or (parent / ".git").is_dir():
-            # Check one more time in case .env is here
-            if candidate.is_file():
-                return candidate
+        if is_root:
             break
     return None
 
 
+# Resolved once at import; shared by every Settings instantiation
+_DOTENV_PATH = _find_dotenv()
+
+# Same spellings pydantic accepts as True for bool fields
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+
 class Settings(BaseSettings):
     """
     Runtime configuration.
@@ -38,7 +65,7 @@ class Settings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        env_file=_find_dotenv(),
+        env_file=_DOTENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -52,6 +79,8 @@ class Settings(BaseSettings):
     # LLM (OpenAI by default; works with any OpenAI-compatible API)
     llm_base_url: str = Field(default="https://api.openai.com/v1", validation_alias="LLM_BASE_URL")
     llm_model_name: str = Field(default="gpt-4o-mini", validation_alias="LLM_MODEL_NAME")
+    # Optional cheaper model for a first triage pass (escalates to LLM_MODEL_NAME when unsure)
+    llm_model_name_fast: str | None = Field(default=None, validation_alias="LLM_MODEL_NAME_FAST")
     openai_api_key: SecretStr | None = Field(default=None, validation_alias="OPENAI_API_KEY")
 
     # Behavior
@@ -61,6 +90,31 @@ class Settings(BaseSettings):
     # Note: Prompt configuration is handled separately via PROMPT_CONFIG_PATH env var
     # or auto-discovered prompt_config.json file. See leads_agent.prompts module.
 
+    @classmethod
+    def fast_load(cls) -> "Settings":
+        """
+        Build settings from the environment and `.env` without pydantic validation.
+
+        Only does the coercions this config needs (SecretStr and bool fields);
+        values are otherwise trusted as-is. Used by get_settings() when
+        LEADS_AGENT_SKIP_VALIDATION=1.
+        """
+        env: dict[str, str | None] = dict(dotenv_values(_DOTENV_PATH)) if _DOTENV_PATH else {}
+        env.update(os.environ)
+
+        values: dict[str, object] = {}
+        for name, field in cls.model_fields.items():
+            raw = env.get(field.validation_alias)
+            if raw is None:
+                continue
+            if field.annotation is bool:
+                values[name] = raw.strip().lower() in _TRUTHY
+            elif SecretStr in get_args(field.annotation):
+                values[name] = SecretStr(raw)
+            else:
+                values[name] = raw
+        return cls.model_construct(**values)
+
     def require_slack_socket_mode(self) -> "Settings":
         """Validate settings required for Socket Mode."""
         missing: list[str] = []
@@ -82,16 +136,23 @@ class Settings(BaseSettings):
         return self
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance (convenience for CLI)."""
+    """
+    Get the process-wide settings instance (convenience for CLI).
+
+    Built once and reused so `.env` is only parsed on first access.
+    Call `get_settings.cache_clear()` to force a reload. Set
+    LEADS_AGENT_SKIP_VALIDATION=1 to skip pydantic-settings validation.
+    """
+    if os.environ.get("LEADS_AGENT_SKIP_VALIDATION") == "1":
+        return Settings.fast_load()
     return Settings()
 
 
 
 def _find_prompt_config_source() -> str | None:
     """Find where prompt configuration is being loaded from."""
-    import os
-
     # Check env var first
     env_path = os.environ.get("PROMPT_CONFIG_PATH")
     if env_path and Path(env_path).is_file():
@@ -116,7 +177,7 @@ def display_config():
         settings = get_settings()
     except Exception as e:
         rprint(f"[red]Error loading settings:[/] {e}")
-        raise typer.Exit(1)
+        raise LeadsAgentExit(1)
 
     table = Table(title="Current Configuration", show_header=True, header_style="bold cyan")
     table.add_column("Setting", style="cyan")
@@ -129,6 +190,7 @@ def display_config():
     table.add_row("OPENAI_API_KEY", mask_secret(settings.openai_api_key))
     table.add_row("LLM_BASE_URL", settings.llm_base_url)
     table.add_row("LLM_MODEL_NAME", settings.llm_model_name)
+    table.add_row("LLM_MODEL_NAME_FAST", settings.llm_model_name_fast or "[not set]")
     table.add_row("DRY_RUN", str(settings.dry_run))
     table.add_row("DEBUG", str(settings.debug))
 
@@ -1,34 +1,89 @@
 import json
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
+from io import StringIO
+from json.decoder import WHITESPACE
 from pathlib import Path
 
-from leads_agent.agent import ClassificationResult, classify_lead
+from leads_agent.agent import classify_lead
+from leads_agent.common import truncate
 from leads_agent.config import Settings, get_settings
-from leads_agent.models import EnrichedLeadClassification, HubSpotLead
-
+from leads_agent.core.render import render_result
+from leads_agent.models import HubSpotLead
+
+_LABEL_EMOJI = {"ignore": "🚫", "promising": "✅"}
+
+
+def _iter_json_array(text: str, source: Path) -> Iterator[dict]:
+    """Yield the items of a top-level JSON array, decoding one at a time."""
+    decoder = json.JSONDecoder()
+
+    idx = WHITESPACE.match(text, 0).end()
+    if text[idx : idx + 1] != "[":
+        raise ValueError(f"Expected JSON array in {source}")
+    idx = WHITESPACE.match(text, idx + 1).end()
+    if text[idx : idx + 1] == "]":
+        return
+
+    while True:
+        item, idx = decoder.raw_decode(text, idx)
+        yield item
+        idx = WHITESPACE.match(text, idx).end()
+        sep = text[idx : idx + 1]
+        if sep == "]":
+            return
+        if sep != ",":
+            raise ValueError(f"Malformed JSON array in {source} at offset {idx}")
+        idx = WHITESPACE.match(text, idx + 1).end()
+
+
+def _iter_json_lines(path: Path, bot_messages_only: bool) -> Iterator[dict]:
+    """Yield one event per line, optionally skipping lines that can't be bot messages."""
+    with path.open("rb") as f:
+        for line in f:
+            # Cheap byte-level pre-filter: avoid decoding events that can't be leads
+            if bot_messages_only and b'"bot_message"' not in line:
+                continue
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def iter_events_from_file(file_path: str | Path, *, bot_messages_only: bool = False) -> Iterator[dict]:
+    """
+    Lazily decode raw events from a file created by `collect`.
 
-def load_events_from_file(file_path: str | Path) -> list[dict]:
-    """Load raw events from a JSON file created by `collect`."""
+    Accepts JSON Lines (current `collect` output) or a single JSON array
+    (older collections). Events are decoded one at a time, so callers that
+    stop early (e.g. backtest with --limit) never decode the rest of the file.
+    With `bot_messages_only`, JSON Lines records that don't mention
+    "bot_message" are skipped before decoding.
+    """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Events file not found: {path}")
-    
-    with open(path) as f:
-        data = json.load(f)
-    
-    if not isinstance(data, list):
-        raise ValueError(f"Expected JSON array, got {type(data).__name__}")
-    
-    return data
+
+    with path.open("rb") as f:
+        head = f.read(4096).lstrip()
+    if head.startswith(b"["):
+        return _iter_json_array(path.read_text(), path)
+    return _iter_json_lines(path, bot_messages_only)
+
+
+def load_events_from_file(file_path: str | Path) -> list[dict]:
+    """Load raw events from a JSON file created by `collect`."""
+    return list(iter_events_from_file(file_path))
 
 
-def extract_leads_from_events(events: list[dict]) -> Iterable[tuple[dict, HubSpotLead]]:
+def extract_leads_from_events(events: Iterable[dict]) -> Iterable[tuple[dict, HubSpotLead]]:
     """
     Extract HubSpot leads from collected events.
     
     Handles both raw Socket Mode payloads and webhook-style events.
     Supports both old format (just payload) and new format (with type/envelope_id/payload).
+    Events redelivered by Slack (same channel + ts) are only parsed and yielded once.
     """
+    seen: set[tuple[str | None, str]] = set()
     for event_record in events:
         # Handle new format: {type, envelope_id, payload, ...}
         if "payload" in event_record and "type" in event_record:
@@ -39,19 +94,28 @@ def extract_leads_from_events(events: list[dict]) -> Iterable[tuple[dict, HubSpo
         
         # Socket Mode payload has event nested under "event" key
         event = payload.get("event", payload)
-        
-        # Skip non-message events
-        if event.get("type") != "message":
+        ev_get = event.get
+
+        # Only process HubSpot bot messages (subtype is the most selective check)
+        if ev_get("subtype") != "bot_message":
             continue
-        
-        # Only process HubSpot bot messages
-        if event.get("subtype") != "bot_message":
+        if ev_get("type") != "message":
             continue
-        if event.get("username", "").lower() != "hubspot":
+        username = ev_get("username")
+        if not username or username.lower() != "hubspot":
             continue
         # Skip thread replies
-        if event.get("thread_ts") and event.get("thread_ts") != event.get("ts"):
+        thread_ts = ev_get("thread_ts")
+        if thread_ts and thread_ts != ev_get("ts"):
             continue
+        # Skip Socket Mode retries of an event we've already handled (only events with a ts
+        # can be identified; the rest are never treated as duplicates)
+        ts = ev_get("ts")
+        if ts:
+            key = (ev_get("channel"), ts)
+            if key in seen:
+                continue
+            seen.add(key)
 
         # Parse the lead
         lead = HubSpotLead.from_slack_event(event)
@@ -71,7 +135,7 @@ def run_backtest(
     Run classification on leads from a collected events file.
     
     Args:
-        events_file: Path to JSON file created by `leads-agent collect`
+        events_file: Path to JSON Lines (or JSON array) file created by `leads-agent collect`
         settings: Application settings
         limit: Max number of leads to process (None = all)
         max_searches: Max web searches per lead
@@ -81,9 +145,10 @@ def run_backtest(
     if settings is None:
         settings = get_settings()
 
-    # Load events from file
-    events = load_events_from_file(events_file)
-    print(f"Loaded {len(events)} events from {events_file}\n")
+    # Stream events from file (decoded lazily, so --limit stops early)
+    events = iter_events_from_file(events_file, bot_messages_only=True)
+    size_kb = Path(events_file).stat().st_size / 1024
+    print(f"Reading events from {events_file} ({size_kb:.1f} KB)\n")
 
     modes = []
     if debug:
@@ -98,93 +163,81 @@ def run_backtest(
             break
             
         count += 1
-        print("=" * 60)
-        print(f"[{count}] Processing lead...")
+        # Collect each lead's output in one buffer and write it in a single call
+        buf = StringIO()
+        print("=" * 60, file=buf)
+        print(f"[{count}] Processing lead...", file=buf)
 
         if debug:
-            print(f"    Input: {lead.first_name} {lead.last_name} <{lead.email}>")
+            print(f"    Input: {lead.first_name} {lead.last_name} <{lead.email}>", file=buf)
             if lead.company:
-                print(f"    Company: {lead.company}")
+                print(f"    Company: {lead.company}", file=buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()  # show progress before the (slow) LLM call
+        buf = StringIO()
 
         result = classify_lead(settings, lead, max_searches=max_searches, debug=debug)
 
-        # Handle ClassificationResult wrapper when debug=True
-        if isinstance(result, ClassificationResult):
-            classification = result.classification
-            label_value = result.label
-            confidence = result.confidence
-            reason = result.reason
-
-            if debug:
-                print(f"\n    Token usage: {result.usage}")
-                print(f"    Messages exchanged: {len(result.message_history)}")
-                if verbose:
-                    print("\n    --- Message History ---")
-                    print(result.format_history(verbose=True))
-                else:
-                    # Show condensed history - just tool calls
-                    for msg in result.message_history:
-                        if hasattr(msg, "parts"):
-                            for part in msg.parts:
-                                if hasattr(part, "tool_name"):
-                                    args_str = str(getattr(part, "args", {}))
-                                    if len(args_str) > 80:
-                                        args_str = args_str[:80] + "..."
-                                    print(f"    🔧 {part.tool_name}: {args_str}")
-        else:
-            classification = result
-            label_value = result.label.value
-            confidence = result.confidence
-            reason = result.reason
-
-        label_emoji = {"ignore": "🚫", "promising": "✅"}.get(label_value, "❓")
+        r = render_result(result)
 
-        print()
-        print(f"Name: {lead.first_name} {lead.last_name}")
-        print(f"Email: {lead.email}")
+        if debug:
+            print(f"\n    Token usage: {r.usage}", file=buf)
+            print(f"    Messages exchanged: {len(result.message_history)}", file=buf)
+            if verbose:
+                print("\n    --- Message History ---", file=buf)
+                print(result.format_history(verbose=True), file=buf)
+            else:
+                # Show condensed history - just tool calls
+                for tool_name, args_str in r.tool_calls:
+                    print(f"    🔧 {tool_name}: {truncate(args_str, 80)}", file=buf)
+
+        label_emoji = _LABEL_EMOJI.get(r.label, "❓")
+
+        print(file=buf)
+        print(f"Name: {lead.first_name} {lead.last_name}", file=buf)
+        print(f"Email: {lead.email}", file=buf)
         if lead.company:
-            print(f"Company: {lead.company}")
+            print(f"Company: {lead.company}", file=buf)
         if lead.message:
-            msg_preview = lead.message[:200] + "..." if len(lead.message) > 200 else lead.message
-            print(f"Message: {msg_preview}")
-        print()
-        label_display = label_value.upper() if isinstance(label_value, str) else label_value
-        print(f"{label_emoji} {label_display} ({confidence:.0%})")
-        print(f"Reason: {reason}")
-        if hasattr(classification, "score"):
-            try:
-                print(f"Score: {classification.score}/5 ({classification.action.value})")
-                print(f"Score Reason: {classification.score_reason}")
-            except Exception:
-                pass
-        if getattr(classification, "lead_summary", None):
-            print(f"Summary: {classification.lead_summary}")
-        if getattr(classification, "key_signals", None):
-            print(f"Signals: {', '.join(classification.key_signals)}")
-        if classification.company:
-            print(f"Extracted Company: {classification.company}")
+            print(f"Message: {truncate(lead.message, 200)}", file=buf)
+        print(file=buf)
+        if result.timed_out:
+            print("⏳ NOT CLASSIFIED (LLM request timed out)", file=buf)
+        else:
+            print(f"{label_emoji} {r.label.upper()} ({r.confidence:.0%})", file=buf)
+        print(f"Reason: {r.reason}", file=buf)
+        if r.score is not None and r.action is not None:
+            print(f"Score: {r.score}/5 ({r.action})", file=buf)
+            print(f"Score Reason: {r.score_reason}", file=buf)
+        if r.lead_summary:
+            print(f"Summary: {r.lead_summary}", file=buf)
+        if r.key_signals:
+            print(f"Signals: {', '.join(r.key_signals)}", file=buf)
+        if r.company:
+            print(f"Extracted Company: {r.company}", file=buf)
 
         # Show enrichment results if available
-        if isinstance(classification, EnrichedLeadClassification):
-            if classification.company_research:
-                print("\n📊 Company Research:")
-                cr = classification.company_research
-                print(f"   {cr.company_name}: {cr.company_description}")
-                if cr.industry:
-                    print(f"   Industry: {cr.industry}")
-                if cr.website:
-                    print(f"   Website: {cr.website}")
-
-            if classification.contact_research:
-                print("\n👤 Contact Research:")
-                cr = classification.contact_research
-                if cr.title:
-                    print(f"   {cr.full_name} - {cr.title}")
-                if cr.linkedin_summary:
-                    print(f"   {cr.linkedin_summary[:200]}...")
-
-            if classification.research_summary:
-                print(f"\n📝 Summary: {classification.research_summary}")
+        if r.company_research:
+            print("\n📊 Company Research:", file=buf)
+            cr = r.company_research
+            print(f"   {cr.company_name}: {cr.company_description}", file=buf)
+            if cr.industry:
+                print(f"   Industry: {cr.industry}", file=buf)
+            if cr.website:
+                print(f"   Website: {cr.website}", file=buf)
+
+        if r.contact_research:
+            print("\n👤 Contact Research:", file=buf)
+            cr = r.contact_research
+            if cr.title:
+                print(f"   {cr.full_name} - {cr.title}", file=buf)
+            if cr.linkedin_summary:
+                print(f"   {truncate(cr.linkedin_summary, 200)}", file=buf)
+
+        if r.research_summary:
+            print(f"\n📝 Summary: {r.research_summary}", file=buf)
+
+        sys.stdout.write(buf.getvalue())
 
     print("=" * 60)
     if count == 0:
@@ -1,15 +1,45 @@
 from rich import print as rprint
-import typer
 from rich.panel import Panel
 from rich.table import Table
 from rich.console import Console
 
-from leads_agent.agent import ClassificationResult, classify_message
-from leads_agent.models import EnrichedLeadClassification
+from leads_agent.agent import classify_message
 from leads_agent.config import get_settings
+from leads_agent.core.render import render_result
 
 console = Console()
 
+_LABEL_COLOR = {"ignore": "red", "promising": "green"}
+
+# (RenderedResult attribute, row label, formatter) — rows are only shown when set
+_TABLE_FIELDS = (
+    ("score", "Score", lambda v: f"{v}/5"),
+    ("action", "Action", str),
+    ("score_reason", "Score Reason", str),
+    ("lead_summary", "Summary", str),
+    ("key_signals", "Signals", ", ".join),
+    ("full_name", "Name", str),
+    ("email", "Email", str),
+    ("company", "Company", str),
+)
+
+# (research attribute, label) pairs for the enrichment sections, same "only when set" rule
+_COMPANY_FIELDS = (
+    ("company_name", "Company"),
+    ("company_description", "Description"),
+    ("industry", "Industry"),
+    ("company_size", "Size"),
+    ("website", "Website"),
+    ("relevance_notes", "Relevance"),
+)
+_CONTACT_FIELDS = (
+    ("full_name", "Name"),
+    ("title", "Title"),
+    ("linkedin_summary", "Summary"),
+    ("relevance_notes", "Relevance"),
+)
+
+
 def classify(message: str, debug: bool, max_searches: int, verbose: bool):
     settings = get_settings()
 
@@ -17,86 +47,58 @@ def classify(message: str, debug: bool, max_searches: int, verbose: bool):
     rprint(Panel.fit(title, border_style="yellow"))
     rprint(f"[dim]{message}[/]\n")
 
-    result = classify_message(settings, message, debug=debug, max_searches=max_searches)
+    # In debug mode, stream triage and show the decision as soon as it firms up
+    on_partial = None
+    if debug:
+        shown: set[tuple[str, str]] = set()
 
-    # Handle both return types
-    if isinstance(result, ClassificationResult):
-        classification = result.classification
-        label_value = result.label
-        confidence = result.confidence
-        reason = result.reason
-    else:
-        classification = result
-        label_value = result.label.value
-        confidence = result.confidence
-        reason = result.reason
+        def on_partial(partial) -> None:
+            if partial.label is None or partial.confidence is None:
+                return
+            key = (partial.label.value, f"{partial.confidence:.0%}")
+            if key not in shown:
+                shown.add(key)
+                rprint(f"[dim]… triage: {key[0]} ({key[1]})[/]")
+
+    result = classify_message(settings, message, debug=debug, max_searches=max_searches, on_partial=on_partial)
+    r = render_result(result)
 
     table = Table(show_header=False, box=None)
     table.add_column("Field", style="cyan")
     table.add_column("Value")
 
-    decision_color = {"ignore": "red", "promising": "green"}.get(label_value, "white")
-    table.add_row("Decision", f"[bold {decision_color}]{label_value}[/]")
-    table.add_row("Confidence", f"{confidence:.0%}")
-    table.add_row("Reason", reason)
-
-    if getattr(classification, "score", None) is not None:
-        table.add_row("Score", f"{classification.score}/5")
-    if getattr(classification, "action", None) is not None:
-        table.add_row("Action", classification.action.value)
-    if getattr(classification, "score_reason", None):
-        table.add_row("Score Reason", classification.score_reason)
-
-    if classification.lead_summary:
-        table.add_row("Summary", classification.lead_summary)
-    if classification.key_signals:
-        table.add_row("Signals", ", ".join(classification.key_signals))
-
-    # Show extracted contact info if present
-    if classification.first_name or classification.last_name:
-        name = f"{classification.first_name or ''} {classification.last_name or ''}".strip()
-        table.add_row("Name", name)
-    if classification.email:
-        table.add_row("Email", classification.email)
-    if classification.company:
-        table.add_row("Company", classification.company)
+    decision_color = _LABEL_COLOR.get(r.label, "white")
+    table.add_row("Decision", f"[bold {decision_color}]{r.label}[/]")
+    table.add_row("Confidence", f"{r.confidence:.0%}")
+    table.add_row("Reason", r.reason)
+
+    for attr, label, fmt in _TABLE_FIELDS:
+        value = getattr(r, attr)
+        if value:
+            table.add_row(label, fmt(value))
 
     console.print(table)
 
-    # Show enrichment results if available
-    if isinstance(classification, EnrichedLeadClassification):
-        if classification.company_research:
-            rprint("\n[bold green]─── Company Research ───[/]")
-            cr = classification.company_research
-            rprint(f"[cyan]Company:[/] {cr.company_name}")
-            rprint(f"[cyan]Description:[/] {cr.company_description}")
-            if cr.industry:
-                rprint(f"[cyan]Industry:[/] {cr.industry}")
-            if cr.company_size:
-                rprint(f"[cyan]Size:[/] {cr.company_size}")
-            if cr.website:
-                rprint(f"[cyan]Website:[/] {cr.website}")
-            if cr.relevance_notes:
-                rprint(f"[cyan]Relevance:[/] {cr.relevance_notes}")
-
-        if classification.contact_research:
-            rprint("\n[bold green]─── Contact Research ───[/]")
-            cr = classification.contact_research
-            rprint(f"[cyan]Name:[/] {cr.full_name}")
-            if cr.title:
-                rprint(f"[cyan]Title:[/] {cr.title}")
-            if cr.linkedin_summary:
-                rprint(f"[cyan]Summary:[/] {cr.linkedin_summary}")
-            if cr.relevance_notes:
-                rprint(f"[cyan]Relevance:[/] {cr.relevance_notes}")
-
-        if classification.research_summary:
-            rprint("\n[bold green]─── Research Summary ───[/]")
-            rprint(classification.research_summary)
+    # Show enrichment results if available (research objects come from the render snapshot)
+    for heading, research, fields in (
+        ("Company Research", r.company_research, _COMPANY_FIELDS),
+        ("Contact Research", r.contact_research, _CONTACT_FIELDS),
+    ):
+        if not research:
+            continue
+        rprint(f"\n[bold green]─── {heading} ───[/]")
+        for attr, label in fields:
+            value = getattr(research, attr)
+            if value:
+                rprint(f"[cyan]{label}:[/] {value}")
+
+    if r.research_summary:
+        rprint("\n[bold green]─── Research Summary ───[/]")
+        rprint(r.research_summary)
 
     # Show debug info if requested
-    if debug and isinstance(result, ClassificationResult):
+    if debug:
         rprint("\n[bold cyan]─── Debug Info ───[/]")
-        rprint(f"[dim]Token usage:[/] {result.usage}")
+        rprint(f"[dim]Token usage:[/] {r.usage}")
         rprint(f"\n[bold cyan]─── Message History ({len(result.message_history)} messages) ───[/]")
-        rprint(f"[dim]{result.format_history(verbose=verbose)}[/]")
\ No newline at end of file
+        rprint(f"[dim]{result.format_history(verbose=verbose)}[/]")
@@ -2,8 +2,28 @@ from pathlib import Path
 from rich import print as rprint
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+import click
 import typer
 import json
+import os
+
+_QUESTIONS_TEMPLATE = "# One qualifying question per line. Lines starting with # are ignored.\n"
+
+
+def _ask_qualifying_questions() -> list[str]:
+    """Collect qualifying questions in one $EDITOR session, or line by line without an editor."""
+    if os.environ.get("VISUAL") or os.environ.get("EDITOR"):
+        raw = click.edit(_QUESTIONS_TEMPLATE) or ""
+        return [line.strip() for line in raw.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+    questions = []
+    while True:
+        q = Prompt.ask("  [cyan]Question[/]", default="")
+        if not q:
+            break
+        questions.append(q)
+    return questions
+
 
 def init_wizard(output: Path, force: bool):
 
@@ -90,94 +110,66 @@ def init_wizard(output: Path, force: bool):
                 icp["target_company_sizes"] = [s.strip() for s in target_sizes.split(",")]
             prompt_config["icp"] = icp
 
-        rprint("\n  [bold]Qualifying Questions[/] [dim](one per line, empty line to finish)[/]")
-        questions = []
-        while True:
-            q = Prompt.ask("  [cyan]Question[/]", default="")
-            if not q:
-                break
-            questions.append(q)
+        rprint("\n  [bold]Qualifying Questions[/] [dim](one per line; opens $EDITOR if set, else empty line to finish)[/]")
+        questions = _ask_qualifying_questions()
         if questions:
             prompt_config["qualifying_questions"] = questions
 
-    # Build env content
-    env_lines = [
-        "# Slack credentials (Socket Mode)",
-        f"SLACK_BOT_TOKEN={slack_bot_token}",
-        f"SLACK_APP_TOKEN={slack_app_token}",
-        f"SLACK_CHANNEL_ID={slack_channel_id}",
-    ]
+    # Build env content directly as UTF-8 bytes
+    buf = bytearray()
+
+    def w(line: str = "") -> None:
+        buf.extend(line.encode("utf-8"))
+        buf.extend(b"\n")
+
+    w("# Slack credentials (Socket Mode)")
+    w(f"SLACK_BOT_TOKEN={slack_bot_token}")
+    w(f"SLACK_APP_TOKEN={slack_app_token}")
+    w(f"SLACK_CHANNEL_ID={slack_channel_id}")
     if slack_test_channel_id:
-        env_lines.append(f"SLACK_TEST_CHANNEL_ID={slack_test_channel_id}")
-
-    env_lines.extend(
-        [
-            "",
-            "# LLM configuration (OpenAI by default)",
-            f"OPENAI_API_KEY={openai_api_key}",
-            f"LLM_MODEL_NAME={llm_model_name}",
-            "# Uncomment for Ollama or other OpenAI-compatible providers:",
-            "# LLM_BASE_URL=http://localhost:11434/v1",
-            "",
-            "# Runtime",
-            f"DRY_RUN={str(dry_run).lower()}",
-            f"DEBUG={str(debug).lower()}",
-        ]
-    )
+        w(f"SLACK_TEST_CHANNEL_ID={slack_test_channel_id}")
+
+    w()
+    w("# LLM configuration (OpenAI by default)")
+    w(f"OPENAI_API_KEY={openai_api_key}")
+    w(f"LLM_MODEL_NAME={llm_model_name}")
+    w("# Uncomment for Ollama or other OpenAI-compatible providers:")
+    w("# LLM_BASE_URL=http://localhost:11434/v1")
+    w()
+    w("# Runtime")
+    w(f"DRY_RUN={str(dry_run).lower()}")
+    w(f"DEBUG={str(debug).lower()}")
 
     # Logfire configuration
+    w()
+    w("# Observability (Logfire)")
     if logfire_token:
-        env_lines.extend(
-            [
-                "",
-                "# Observability (Logfire)",
-                f"LOGFIRE_TOKEN={logfire_token}",
-            ]
-        )
+        w(f"LOGFIRE_TOKEN={logfire_token}")
     else:
-        env_lines.extend(
-            [
-                "",
-                "# Observability (Logfire)",
-                "# Get your token at https://logfire.pydantic.dev/",
-                "# LOGFIRE_TOKEN=",
-            ]
-        )
+        w("# Get your token at https://logfire.pydantic.dev/")
+        w("# LOGFIRE_TOKEN=")
 
     # Determine prompt config file path (same directory as .env)
     prompt_config_path = output.parent / "prompt_config.json"
 
     # Add prompt configuration reference
+    w()
+    w("# Prompt Configuration (ICP, qualifying questions, etc.)")
     if prompt_config:
-        env_lines.extend(
-            [
-                "",
-                "# Prompt Configuration (ICP, qualifying questions, etc.)",
-                "# Points to JSON file - edit prompt_config.json to customize",
-                f"PROMPT_CONFIG_PATH={prompt_config_path}",
-            ]
-        )
+        w("# Points to JSON file - edit prompt_config.json to customize")
+        w(f"PROMPT_CONFIG_PATH={prompt_config_path}")
     else:
-        env_lines.extend(
-            [
-                "",
-                "# Prompt Configuration (ICP, qualifying questions, etc.)",
-                "# Uncomment and create prompt_config.json to customize classification",
-                "# See prompt_config.example.json for all available options",
-                f"# PROMPT_CONFIG_PATH={prompt_config_path}",
-            ]
-        )
-
-    env_content = "\n".join(env_lines) + "\n"
+        w("# Uncomment and create prompt_config.json to customize classification")
+        w("# See prompt_config.example.json for all available options")
+        w(f"# PROMPT_CONFIG_PATH={prompt_config_path}")
 
     # Write .env file
-    output.write_text(env_content)
+    output.write_bytes(buf)
     rprint(f"\n[green]✓[/] Configuration written to [bold]{output}[/]")
 
     # Write prompt_config.json if configured
     if prompt_config:
-        prompt_config_content = json.dumps(prompt_config, indent=2)
-        prompt_config_path.write_text(prompt_config_content + "\n")
+        prompt_config_path.write_bytes((json.dumps(prompt_config, indent=2) + "\n").encode("utf-8"))
         rprint(f"[green]✓[/] Prompt configuration written to [bold]{prompt_config_path}[/]")
     else:
         rprint(f"[dim]To customize prompts, create {prompt_config_path} (see prompt_config.example.json)[/]")
@@ -1,23 +1,27 @@
 import hashlib
 import os
+from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-import logfire
-from opentelemetry import trace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from leads_agent.agent import classify_lead
+from leads_agent.common import truncate
 from leads_agent.models import EnrichedLeadClassification, HubSpotLead, LeadClassification
 from leads_agent.slack import slack_client
 
 if TYPE_CHECKING:
+    from slack_sdk import WebClient
+
     from leads_agent.config import Settings
 
-# Configure logfire only if token is available
+# Configure logfire only if token is available (logfire/OpenTelemetry are only imported then)
 _logfire_enabled = bool(os.environ.get("LOGFIRE_TOKEN"))
 if _logfire_enabled:
     try:
+        import logfire
+
         logfire.configure()
     except Exception:
         # If configuration fails, disable logfire
@@ -25,22 +29,43 @@ if _logfire_enabled:
 
 
 @contextmanager
-def _logfire_span(name: str, **kwargs):
-    """Context manager for logfire spans that works even when logfire is disabled."""
+def _logfire_span(name: str, attrs_fn: Callable[[], dict[str, Any]] | None = None, **kwargs):
+    """
+    Context manager for logfire spans that works even when logfire is disabled.
+
+    `attrs_fn` supplies extra span attributes lazily; it is only called when logfire is enabled.
+    """
     if _logfire_enabled:
+        import logfire
+
+        if attrs_fn is not None:
+            kwargs.update(attrs_fn())
         with logfire.span(name, **kwargs):
             yield
     else:
         yield
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessedLead:
-    """Result of processing a lead."""
+    """Result of processing a lead. Slack messages are formatted on first access."""
 
     lead: HubSpotLead
     classification: LeadClassification | EnrichedLeadClassification
-    slack_message: str
+    # Triage timed out, so `classification` is a placeholder rather than a verdict
+    timed_out: bool = False
+
+    @cached_property
+    def slack_message(self) -> str:
+        if self.timed_out:
+            return _NOT_CLASSIFIED
+        return format_slack_message(self.lead, self.classification, include_lead_info=False)
+
+    @cached_property
+    def slack_message_with_lead_info(self) -> str:
+        if self.timed_out:
+            return _format_lead_info(self.lead) + _NOT_CLASSIFIED
+        return format_slack_message(self.lead, self.classification, include_lead_info=True)
 
     @property
     def label(self) -> str:
@@ -51,89 +76,103 @@ class ProcessedLead:
         return self.label == "promising"
 
 
-def format_slack_message(
+# Decision header: label line + italic reason
+_GO_HEADER = "✅ *GO* ({:.0%})\n_{}_"
+_IGNORE_HEADER = "🚫 *IGNORE* ({:.0%})\n_{}_"
+
+# Posted instead of a verdict when the LLM timed out, so the lead isn't mistaken for an IGNORE
+_NOT_CLASSIFIED = "⏳ *NOT CLASSIFIED*\n_The LLM request timed out. Retry with `leads-agent replay`._"
+
+
+def _format_lead_info(lead: HubSpotLead) -> str:
+    """Lead details header (for test channel posts), ending with a blank line."""
+    name = lead.full_name or "Unknown"
+    email = lead.email
+    email_display = f"<mailto:{email}|{email}>" if email else "no email"
+    company = f"*Company:* {lead.company}\n" if lead.company else ""
+    message = ""
+    if lead.message:
+        message = f"*Message:* {truncate(lead.message, 150)}\n"
+    return f"*Lead:* {name} ({email_display})\n{company}{message}\n"
+
+
+def _format_triage(
     lead: HubSpotLead,
     classification: LeadClassification | EnrichedLeadClassification,
-    include_lead_info: bool = False,
 ) -> str:
-    """
-    Format classification result as a Slack message.
-
-    Args:
-        lead: The parsed lead data
-        classification: The classification result
-        include_lead_info: If True, include lead details (for test channel posts)
-    """
-    parts = []
-
-    # Optionally include lead info header (for test mode)
-    if include_lead_info:
-        name = f"{lead.first_name or ''} {lead.last_name or ''}".strip() or "Unknown"
-        email = lead.email
-        email_display = f"<mailto:{email}|{email}>" if email else "no email"
-        parts.append(f"*Lead:* {name} ({email_display})")
-        if lead.company:
-            parts.append(f"*Company:* {lead.company}")
-        if lead.message:
-            msg_preview = lead.message[:150] + "..." if len(lead.message) > 150 else lead.message
-            parts.append(f"*Message:* {msg_preview}")
-        parts.append("")  # blank line
-
-    # Go / No-go (hide taxonomy)
-    if classification.label.value == "promising":
-        parts.append(f"✅ *GO* ({classification.confidence:.0%})")
-    else:
-        parts.append(f"🚫 *IGNORE* ({classification.confidence:.0%})")
-    parts.append(f"_{classification.reason}_")
+    """Go / no-go decision (taxonomy hidden), optional score, summary, signals and extracted company."""
+    header = _GO_HEADER if classification.label.value == "promising" else _IGNORE_HEADER
+    text = header.format(classification.confidence, classification.reason)
 
     # Optional final score (for promising leads after research+scoring)
-    if getattr(classification, "score", None) is not None and getattr(classification, "action", None) is not None:
-        parts.append(f"\n⭐ *Score:* {classification.score}/5 · *Action:* {classification.action.value}")
-        if getattr(classification, "score_reason", None):
-            parts.append(f"_{classification.score_reason}_")
+    if isinstance(classification, EnrichedLeadClassification):
+        score, action = classification.score, classification.action
+        if score is not None and action is not None:
+            text += f"\n\n⭐ *Score:* {score}/5 · *Action:* {action.value}"
+            if classification.score_reason:
+                text += f"\n_{classification.score_reason}_"
 
     # Optional lead summary/signals (useful when triage output includes them)
     if classification.lead_summary:
-        parts.append(f"\n*🧾 Summary:* {classification.lead_summary}")
+        text += f"\n\n*🧾 Summary:* {classification.lead_summary}"
     if classification.key_signals:
-        parts.append("\n*🏷️ Signals:* " + ", ".join(classification.key_signals))
+        text += f"\n\n*🏷️ Signals:* {', '.join(classification.key_signals)}"
 
     # Extracted company if different
     if classification.company and classification.company != lead.company:
-        parts.append(f"\n📋 Company: {classification.company}")
+        text += f"\n\n📋 Company: {classification.company}"
+
+    return text
+
+
+def _format_enriched(classification: EnrichedLeadClassification) -> str:
+    """Web research sections (company, contact, summary); empty when nothing was found."""
+    text = ""
+    if classification.company_research:
+        cr = classification.company_research
+        text += f"\n\n*📊 Company Research:*\n• *{cr.company_name}*: {cr.company_description}"
+        if cr.industry:
+            text += f"\n• Industry: {cr.industry}"
+        if cr.company_size:
+            text += f"\n• Size: {cr.company_size}"
+        if cr.website:
+            # Format URL for Slack clickability
+            url = cr.website if cr.website.startswith("http") else f"https://{cr.website}"
+            text += f"\n• Website: <{url}|{cr.website}>"
+        if cr.relevance_notes:
+            text += f"\n• Relevance: {cr.relevance_notes}"
+
+    if classification.contact_research:
+        cr = classification.contact_research
+        title_str = f" - {cr.title}" if cr.title else ""
+        text += f"\n\n*👤 Contact Research:*\n• *{cr.full_name}*{title_str}"
+        if cr.linkedin_summary:
+            text += f"\n• {truncate(cr.linkedin_summary, 300)}"
+        if cr.relevance_notes:
+            text += f"\n• Relevance: {cr.relevance_notes}"
+
+    if classification.research_summary:
+        text += f"\n\n*📝 Summary:*\n{classification.research_summary}"
+
+    return text
 
-    # Enrichment results
-    if isinstance(classification, EnrichedLeadClassification):
-        if classification.company_research:
-            cr = classification.company_research
-            parts.append("\n*📊 Company Research:*")
-            parts.append(f"• *{cr.company_name}*: {cr.company_description}")
-            if cr.industry:
-                parts.append(f"• Industry: {cr.industry}")
-            if cr.company_size:
-                parts.append(f"• Size: {cr.company_size}")
-            if cr.website:
-                # Format URL for Slack clickability
-                url = cr.website if cr.website.startswith("http") else f"https://{cr.website}"
-                parts.append(f"• Website: <{url}|{cr.website}>")
-            if cr.relevance_notes:
-                parts.append(f"• Relevance: {cr.relevance_notes}")
-
-        if classification.contact_research:
-            cr = classification.contact_research
-            parts.append("\n*👤 Contact Research:*")
-            title_str = f" - {cr.title}" if cr.title else ""
-            parts.append(f"• *{cr.full_name}*{title_str}")
-            if cr.linkedin_summary:
-                summary = cr.linkedin_summary[:300] + "..." if len(cr.linkedin_summary) > 300 else cr.linkedin_summary
-                parts.append(f"• {summary}")
-            if cr.relevance_notes:
-                parts.append(f"• Relevance: {cr.relevance_notes}")
-
-        if classification.research_summary:
-            parts.append(f"\n*📝 Summary:*\n{classification.research_summary}")
-
-    return "\n".join(parts)
+
+def format_slack_message(
+    lead: HubSpotLead,
+    classification: LeadClassification | EnrichedLeadClassification,
+    include_lead_info: bool = False,
+) -> str:
+    """
+    Format classification result as a Slack message.
+
+    Args:
+        lead: The parsed lead data
+        classification: The classification result
+        include_lead_info: If True, include lead details (for test channel posts)
+    """
+    lead_info = _format_lead_info(lead) if include_lead_info else ""
+    enriched = _format_enriched(classification) if isinstance(classification, EnrichedLeadClassification) else ""
+    return f"{lead_info}{_format_triage(lead, classification)}{enriched}"
 
 
 def process_lead(
@@ -145,27 +184,20 @@ def process_lead(
     """
     Process a single lead: classify and format response.
 
+    Classifications are cached in-process by classify_lead(), so processing the
+    same lead again doesn't call the LLM.
+
     Args:
         settings: Application settings
         lead: Parsed HubSpot lead
         max_searches: Max web searches for enrichment
 
     Returns:
-        ProcessedLead with classification and formatted Slack message
+        ProcessedLead with classification (Slack message formatted lazily)
     """
-    classification = classify_lead(settings, lead, max_searches=max_searches)
-
-    # Handle ClassificationResult wrapper (from debug mode)
-    if hasattr(classification, "classification"):
-        classification = classification.classification
-
-    slack_message = format_slack_message(lead, classification, include_lead_info=False)
+    result = classify_lead(settings, lead, max_searches=max_searches)
 
-    return ProcessedLead(
-        lead=lead,
-        classification=classification,
-        slack_message=slack_message,
-    )
+    return ProcessedLead(lead=lead, classification=result.classification, timed_out=result.timed_out)
 
 
 def post_to_slack(
@@ -175,6 +207,7 @@ def post_to_slack(
     channel_id: str,
     thread_ts: str | None = None,
     include_lead_info: bool = False,
+    client: "WebClient | None" = None,
 ) -> None:
     """
     Post processed lead result to Slack.
@@ -185,19 +218,16 @@ def post_to_slack(
         channel_id: Slack channel ID to post to
         thread_ts: If provided, post as thread reply; otherwise post to main channel
         include_lead_info: If True, include lead details in message
+        client: Slack client to post with (defaults to a new client for the bot token)
     """
     if settings.dry_run:
         print(f"[DRY RUN] Would post to {channel_id}" + (f" (thread: {thread_ts})" if thread_ts else ""))
         return
 
-    # Re-format with lead info if needed
-    message = (
-        format_slack_message(processed.lead, processed.classification, include_lead_info=include_lead_info)
-        if include_lead_info
-        else processed.slack_message
-    )
+    message = processed.slack_message_with_lead_info if include_lead_info else processed.slack_message
 
-    client = slack_client(settings)
+    if client is None:
+        client = slack_client(settings)
 
     kwargs = {
         "channel": channel_id,
@@ -217,6 +247,7 @@ def process_and_post(
     thread_ts: str | None = None,
     max_searches: int = 4,
     include_lead_info: bool = False,
+    client: "WebClient | None" = None,
 ) -> ProcessedLead:
     """
     Process a lead and post the result to Slack.
@@ -230,47 +261,54 @@ def process_and_post(
         thread_ts: If provided, post as thread reply (production mode)
         max_searches: Max web searches for enrichment
         include_lead_info: Include lead details in message (test mode)
+        client: Slack client to post with (e.g. the one a Bolt handler or replay already has)
 
     Returns:
         ProcessedLead with results
     """
     # Group all agent traces (triage/research/scoring) and Slack posting under one lead span.
-    email_domain = ""
-    if lead.email and "@" in lead.email:
-        email_domain = lead.email.split("@", 1)[1].lower()
-
-    # Prefer Slack timestamp when available; otherwise fall back to a stable short hash.
-    trace_id = thread_ts or (lead.email.lower() if lead.email else "")
-    if not trace_id:
-        base = "|".join(
-            [
-                lead.company or "",
+    def span_attrs() -> dict[str, Any]:
+        # Only computed when logfire is enabled
+        email_domain = lead.email_domain.lower()
+
+        # Prefer Slack timestamp when available; otherwise fall back to a stable short hash.
+        trace_id = thread_ts or (lead.email.lower() if lead.email else "")
+        if not trace_id:
+            h = hashlib.blake2b(digest_size=6, usedforsecurity=False)
+            for part in (
+                lead.company,
                 email_domain,
-                lead.first_name or "",
-                lead.last_name or "",
+                lead.first_name,
+                lead.last_name,
                 (lead.message or lead.raw_text or "")[:500],
-            ]
-        )
-        trace_id = hashlib.sha1(base.encode("utf-8")).hexdigest()[:12]
+            ):
+                h.update((part or "").encode("utf-8"))
+                h.update(b"|")
+            trace_id = h.hexdigest()
+
+        return {
+            "lead_id": trace_id,
+            "slack_channel_id": channel_id,
+            "slack_thread_ts": thread_ts,
+            "email": lead.email,
+            "email_domain": email_domain,
+            "company": lead.company,
+            "max_searches": max_searches,
+            "include_lead_info": include_lead_info,
+            "dry_run": settings.dry_run,
+        }
+
+    # Span names only matter when logfire is on; skip the OTel context lookup otherwise
+    has_parent = False
+    if _logfire_enabled:
+        from opentelemetry import trace
 
-    current = trace.get_current_span()
-    has_parent = current.get_span_context().is_valid
+        has_parent = trace.get_current_span().get_span_context().is_valid
 
     # Only create a top-level lead.process span if we aren't already inside one.
     span_name = "lead.post" if has_parent else "lead.process"
 
-    with _logfire_span(
-        span_name,
-        lead_id=trace_id,
-        slack_channel_id=channel_id,
-        slack_thread_ts=thread_ts,
-        email=lead.email,
-        email_domain=email_domain,
-        company=lead.company,
-        max_searches=max_searches,
-        include_lead_info=include_lead_info,
-        dry_run=settings.dry_run,
-    ):
+    with _logfire_span(span_name, attrs_fn=span_attrs):
         processed = process_lead(settings, lead, max_searches=max_searches)
 
         post_to_slack(
@@ -279,6 +317,7 @@ def process_and_post(
             channel_id=channel_id,
             thread_ts=thread_ts,
             include_lead_info=include_lead_info,
+            client=client,
         )
 
         return processed
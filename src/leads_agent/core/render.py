@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic_ai.messages import ToolCallPart
+
+from leads_agent.agent import ClassificationResult
+from leads_agent.models import (
+    CompanyResearch,
+    ContactResearch,
+    EnrichedLeadClassification,
+    LeadClassification,
+)
+
+
+@dataclass(slots=True)
+class RenderedResult:
+    """Display fields pulled out of a classification result in a single pass."""
+
+    classification: LeadClassification | EnrichedLeadClassification
+    label: str
+    confidence: float
+    reason: str
+    lead_summary: str | None = None
+    key_signals: list[str] | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    email: str | None = None
+    company: str | None = None
+
+    # Scoring/enrichment (only set for EnrichedLeadClassification)
+    score: int | None = None
+    action: str | None = None
+    score_reason: str | None = None
+    company_research: CompanyResearch | None = None
+    contact_research: ContactResearch | None = None
+    research_summary: str | None = None
+
+    # Debug info (message history/usage are empty unless classified with debug=True)
+    result: ClassificationResult | None = None
+    usage: dict[str, Any] = field(default_factory=dict)
+    tool_calls: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name or ''} {self.last_name or ''}".strip()
+
+
+def render_result(result: ClassificationResult) -> RenderedResult:
+    """Extract everything the CLI renderers need from a classify_lead() result."""
+    classification = result.classification
+
+    rendered = RenderedResult(
+        classification=classification,
+        label=classification.label.value,
+        confidence=classification.confidence,
+        reason=classification.reason,
+        lead_summary=classification.lead_summary,
+        key_signals=classification.key_signals,
+        first_name=classification.first_name,
+        last_name=classification.last_name,
+        email=classification.email,
+        company=classification.company,
+    )
+
+    if isinstance(classification, EnrichedLeadClassification):
+        rendered.score = classification.score
+        rendered.action = classification.action.value if classification.action is not None else None
+        rendered.score_reason = classification.score_reason
+        rendered.company_research = classification.company_research
+        rendered.contact_research = classification.contact_research
+        rendered.research_summary = classification.research_summary
+
+    rendered.result = result
+    rendered.usage = result.usage
+    for msg in result.message_history:
+        for part in getattr(msg, "parts", ()):
+            if isinstance(part, ToolCallPart):
+                rendered.tool_calls.append((part.tool_name, str(part.args or {})))
+
+    return rendered
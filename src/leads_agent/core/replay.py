@@ -1,13 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from slack_sdk.errors import SlackApiError
 from rich import print as rprint
-import typer
 from rich.panel import Panel
 
 from leads_agent.models import HubSpotLead
 from leads_agent.core.processor import process_and_post
-from leads_agent.slack import slack_client
+from leads_agent.slack import SLACK_ERROR_HINTS, slack_client
+from leads_agent.common import LeadsAgentExit
 from leads_agent.config import get_settings
 
+# Common spellings of the HubSpot bot username, checked before falling back to .lower()
+_HUBSPOT_NAMES = frozenset({"HubSpot", "hubspot", "HUBSPOT"})
+
+# Leads are LLM + Slack bound, so a page's leads are processed concurrently
+_MAX_WORKERS = 8
+
+
+def _is_hubspot_lead(msg: dict) -> bool:
+    """Quick filter for top-level HubSpot bot messages with attachments (matches production)."""
+    if msg.get("subtype") != "bot_message":
+        return False
+    username = msg.get("username")
+    if username not in _HUBSPOT_NAMES and (not username or username.lower() != "hubspot"):
+        return False
+    thread_ts = msg.get("thread_ts")
+    if thread_ts and thread_ts != msg.get("ts"):
+        return False
+    return bool(msg.get("attachments"))
 
 
 def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
@@ -16,20 +36,20 @@ def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
         settings.require_slack_client()
     except Exception as e:
         rprint(f"[red]Error loading Slack settings:[/] {e}")
-        raise typer.Exit(1)
+        raise LeadsAgentExit(1)
 
     # Override dry_run if explicitly set
     if dry_run is not None:
-        settings.dry_run = dry_run
+        settings = settings.model_copy(update={"dry_run": dry_run})
 
     target_channel = channel_id or settings.slack_channel_id
     if not target_channel:
         rprint("[red]Error:[/] No channel ID provided. Use --channel or set SLACK_CHANNEL_ID")
-        raise typer.Exit(1)
+        raise LeadsAgentExit(1)
 
     if limit <= 0:
         rprint("[red]Error:[/] --limit must be >= 1")
-        raise typer.Exit(1)
+        raise LeadsAgentExit(1)
 
     client = slack_client(settings)
 
@@ -38,84 +58,91 @@ def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
 
     # Paginate until we replay `limit` HubSpot lead messages (or history is exhausted).
     processed = 0
-    cursor: str | None = None
     scanned = 0
 
-    try:
-        while processed < limit:
-            history_kwargs: dict = {"channel": target_channel, "limit": 200}
-            if cursor:
-                history_kwargs["cursor"] = cursor
-
-            resp = client.conversations_history(**history_kwargs)
-
-            messages = resp.get("messages", [])
-            scanned += len(messages)
-
-            if not messages:
-                break
-
-            for msg in messages:
-                # conversations_history messages don't include channel; add for parity with event payloads
-                event = dict(msg)
-                event["channel"] = target_channel
-
-                # Quick filter (match production behavior)
-                if event.get("subtype") != "bot_message":
-                    continue
-                if event.get("username", "").lower() != "hubspot":
-                    continue
-                if event.get("thread_ts") and event.get("thread_ts") != event.get("ts"):
-                    continue
-                if not event.get("attachments"):
-                    continue
-
-                lead = HubSpotLead.from_slack_event(event)
-                if not lead:
-                    continue
-
-                processed += 1
-
-                result = process_and_post(
-                    settings,
-                    lead,
-                    channel_id=target_channel,
-                    thread_ts=event.get("ts"),  # replay as thread reply, like production
-                    max_searches=max_searches,
-                )
-
-                if settings.dry_run:
-                    rprint(
-                        Panel(
-                            result.slack_message,
-                            title=f"Replay {processed}/{limit}",
-                            border_style="yellow",
-                        )
-                    )
-                else:
-                    ts = event.get("ts", "?")
-                    rprint(f"[green]✓[/] Posted replay {processed}/{limit} (thread_ts={ts})")
+    def fetch_page(cursor: str | None) -> dict:
+        history_kwargs: dict = {"channel": target_channel, "limit": 200}
+        if cursor:
+            history_kwargs["cursor"] = cursor
+        return client.conversations_history(**history_kwargs)
 
-                if processed >= limit:
+    try:
+        # One background fetcher, so the next page downloads while this page's leads are processed.
+        # The lead pool lives across pages so its threads keep their cached LLM providers/agents.
+        with (
+            ThreadPoolExecutor(max_workers=1) as fetcher,
+            ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool,
+        ):
+            next_page = fetcher.submit(fetch_page, None)
+            while next_page is not None:
+                resp = next_page.result()
+                next_page = None
+
+                messages = resp.get("messages", [])
+                scanned += len(messages)
+
+                if not messages:
                     break
 
-            cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
-            if not cursor:
-                break
+                batch: list[tuple[dict, HubSpotLead]] = []
+                for msg in messages:
+                    if not _is_hubspot_lead(msg):
+                        continue
+
+                    # conversations_history messages lack "channel", but nothing downstream reads it
+                    # (we post to target_channel), so the message is used as-is rather than copied
+                    lead = HubSpotLead.from_slack_event(msg)
+                    if not lead:
+                        continue
+
+                    batch.append((msg, lead))
+                    if processed + len(batch) >= limit:
+                        break
+
+                # Only prefetch when this page can't satisfy the limit
+                cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
+                if cursor and processed + len(batch) < limit:
+                    next_page = fetcher.submit(fetch_page, cursor)
+
+                futures = [
+                    (
+                        event,
+                        pool.submit(
+                            process_and_post,
+                            settings,
+                            lead,
+                            channel_id=target_channel,
+                            thread_ts=event.get("ts"),  # replay as thread reply, like production
+                            max_searches=max_searches,
+                            client=client,
+                        ),
+                    )
+                    for event, lead in batch
+                ]
+                # Results are reported from this thread only, in channel-history order
+                for event, future in futures:
+                    result = future.result()
+                    processed += 1
+
+                    if settings.dry_run:
+                        rprint(
+                            Panel(
+                                result.slack_message,
+                                title=f"Replay {processed}/{limit}",
+                                border_style="yellow",
+                            )
+                        )
+                    else:
+                        ts = event.get("ts", "?")
+                        rprint(f"[green]✓[/] Posted replay {processed}/{limit} (thread_ts={ts})")
 
     except SlackApiError as e:
         error_code = e.response.get("error", "unknown")
         rprint(f"[red]Slack API error:[/] {error_code}")
 
-        hints = {
-            "not_in_channel": "The bot must be invited to the channel. Use /invite @bot-name in Slack.",
-            "channel_not_found": "Check that the channel ID is correct.",
-            "missing_scope": "The bot token needs 'channels:history' (public) or 'groups:history' (private) scope.",
-            "invalid_auth": "The SLACK_BOT_TOKEN is invalid or expired.",
-        }
-        if error_code in hints:
-            rprint(f"[yellow]Hint:[/] {hints[error_code]}")
-        raise typer.Exit(1)
+        if error_code in SLACK_ERROR_HINTS:
+            rprint(f"[yellow]Hint:[/] {SLACK_ERROR_HINTS[error_code]}")
+        raise LeadsAgentExit(1)
 
     if processed == 0:
         rprint("[yellow]No HubSpot lead messages found in the scanned history.[/]")
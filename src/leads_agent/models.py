@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+# HubSpot attachment fields: *Field Name*: Value
+# One scan finds every field marker; the value pattern for that field is then matched in place.
+# Handle both plain text and Slack markdown links like <mailto:email|email>
+_FIELD_MARKER_RE = re.compile(r"\*(First Name|Last Name|Email|Company|Message)\*:", re.IGNORECASE)
+_LINE_VALUE_RE = re.compile(r"\s*(.+?)(?=\n\*|\n*$)", re.IGNORECASE | re.DOTALL)
+_FIELD_VALUES = {
+    "first name": ("first_name", _LINE_VALUE_RE),
+    "last name": ("last_name", _LINE_VALUE_RE),
+    "email": ("email", re.compile(r"\s*(?:<mailto:[^|]+\|)?([^\s>]+)", re.IGNORECASE | re.DOTALL)),
+    "company": ("company", _LINE_VALUE_RE),
+    "message": ("message", re.compile(r"\s*(.+)", re.IGNORECASE | re.DOTALL)),
+}
+_MAILTO_RE = re.compile(r"<mailto:[^|]+\|([^>]+)>")
+_LINK_RE = re.compile(r"<[^|]+\|([^>]+)>")
+
 
 class LeadLabel(str, Enum):
     ignore = "ignore"
@@ -19,8 +36,14 @@ class LeadAction(str, Enum):
     prioritize = "prioritize"
 
 
-class HubSpotLead(BaseModel):
-    """Parsed lead data from HubSpot Slack message."""
+@dataclass(slots=True, frozen=True)
+class HubSpotLead:
+    """
+    Parsed lead data from HubSpot Slack message.
+
+    A plain slotted dataclass rather than a pydantic model: backtests build one
+    per collected event, and nothing validates or serializes it.
+    """
 
     first_name: str | None = None
     last_name: str | None = None
@@ -36,51 +59,62 @@ class HubSpotLead(BaseModel):
 
         Returns None if this isn't a HubSpot message.
         """
-        # Must be a bot_message from HubSpot
+        # Must be a bot_message from HubSpot (cheapest checks first)
         if event.get("subtype") != "bot_message":
             return None
-        if event.get("username", "").lower() != "hubspot":
+        username = event.get("username")
+        if not username or (username != "HubSpot" and username.lower() != "hubspot"):
             return None
 
         # Get text from attachments (HubSpot puts lead data there)
-        attachments = event.get("attachments", [])
+        attachments = event.get("attachments")
         if not attachments:
             return None
 
         # Use fallback or text from first attachment
         attachment = attachments[0]
-        raw_text = attachment.get("fallback") or attachment.get("text") or ""
-
+        raw_text = attachment.get("fallback") or attachment.get("text")
         if not raw_text:
             return None
 
         return cls._parse_hubspot_text(raw_text)
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def _parse_hubspot_text(cls, text: str) -> HubSpotLead:
-        """Parse HubSpot formatted text to extract lead fields."""
-        lead = cls(raw_text=text)
-
-        # Pattern: *Field Name*: Value
-        # Handle both plain text and Slack markdown links like <mailto:email|email>
-        patterns = {
-            "first_name": r"\*First Name\*:\s*(.+?)(?=\n\*|\n*$)",
-            "last_name": r"\*Last Name\*:\s*(.+?)(?=\n\*|\n*$)",
-            "email": r"\*Email\*:\s*(?:<mailto:[^|]+\|)?([^\s>]+)",
-            "company": r"\*Company\*:\s*(.+?)(?=\n\*|\n*$)",
-            "message": r"\*Message\*:\s*(.+)",
-        }
-
-        for field, pattern in patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        """
+        Parse HubSpot formatted text to extract lead fields.
+
+        Cached by text: leads are immutable, so Slack retries/replays of the same
+        message share one parsed instance.
+        """
+        fields: dict[str, str] = {}
+
+        for marker in _FIELD_MARKER_RE.finditer(text):
+            field, value_re = _FIELD_VALUES[marker.group(1).lower()]
+            if field in fields:
+                continue  # first occurrence wins
+            match = value_re.match(text, marker.end())
             if match:
                 value = match.group(1).strip()
-                # Clean up the value
-                value = re.sub(r"<mailto:[^|]+\|([^>]+)>", r"\1", value)  # Clean email links
-                value = re.sub(r"<[^|]+\|([^>]+)>", r"\1", value)  # Clean other links
-                setattr(lead, field, value)
-
-        return lead
+                # Clean up the value (links are rare, so skip the substitutions without one)
+                if "<" in value:
+                    value = _MAILTO_RE.sub(r"\1", value)  # Clean email links
+                    value = _LINK_RE.sub(r"\1", value)  # Clean other links
+                fields[field] = value
+
+        return cls(raw_text=text, **fields)
+
+    @property
+    def email_domain(self) -> str:
+        """Domain part of the email address, or "" when there isn't one."""
+        _, at, domain = (self.email or "").partition("@")
+        return domain if at else ""
+
+    @property
+    def full_name(self) -> str:
+        """First and last name joined, or "" when neither is set."""
+        return f"{self.first_name or ''} {self.last_name or ''}".strip()
 
     def to_prompt_text(self) -> str:
         """Format lead data for LLM prompt."""
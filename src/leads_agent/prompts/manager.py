@@ -1,7 +1,15 @@
 import json
+import logging
+import os
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from io import StringIO
 from pathlib import Path
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from leads_agent.prompts.prompts import (
     BASE_SYSTEM_PROMPT,
@@ -10,48 +18,94 @@ from leads_agent.prompts.prompts import (
     BASE_RESEARCH_PROMPT,
 )
 
-class ICPConfig(BaseModel):
+logger = logging.getLogger(__name__)
+
+# orjson is optional; both parse the raw file bytes (no separate decode step), and
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# ICPConfig fields, checked by ICPConfig.is_empty()
+_ICP_FIELDS = (
+    "description",
+    "target_industries",
+    "target_company_sizes",
+    "target_roles",
+    "geographic_focus",
+    "disqualifying_signals",
+)
+
+
+class _SchemaCachedModel(BaseModel):
+    """BaseModel whose JSON schema is generated once per class and argument set."""
+
+    _schema_cache: ClassVar[dict[tuple, dict[str, Any]]] = {}
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        try:
+            schema = _SchemaCachedModel._schema_cache[key]
+        except KeyError:
+            schema = _SchemaCachedModel._schema_cache[key] = super().model_json_schema(*args, **kwargs)
+        # Callers may edit the schema (e.g. to add examples), so never hand out the cached dict
+        return deepcopy(schema)
+
+
+class ICPConfig(_SchemaCachedModel):
     """Ideal Client Profile configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     description: str | None = Field(
         default=None,
         description="Free-form description of your ideal client profile",
         examples=["Mid-market B2B SaaS companies looking to modernize their data infrastructure"],
     )
-    target_industries: list[str] | None = Field(
+    target_industries: tuple[str, ...] | None = Field(
         default=None,
         description="List of target industries",
         examples=[["SaaS", "FinTech", "HealthTech", "E-commerce"]],
     )
-    target_company_sizes: list[str] | None = Field(
+    target_company_sizes: tuple[str, ...] | None = Field(
         default=None,
         description="List of target company sizes",
         examples=[["Startup", "SMB", "Mid-Market"]],
     )
-    target_roles: list[str] | None = Field(
+    target_roles: tuple[str, ...] | None = Field(
         default=None,
         description="Target roles/titles for decision makers",
         examples=[["CTO", "VP Engineering", "Head of Data", "Technical Founder"]],
     )
-    geographic_focus: list[str] | None = Field(
+    geographic_focus: tuple[str, ...] | None = Field(
         default=None,
         description="Geographic regions of interest",
         examples=[["US", "Canada", "UK", "EU"]],
     )
-    disqualifying_signals: list[str] | None = Field(
+    disqualifying_signals: tuple[str, ...] | None = Field(
         default=None,
         description="Signals that indicate a lead is not a good fit",
         examples=[["Requesting free services", "Student projects", "Personal use"]],
     )
 
+    def is_empty(self) -> bool:
+        """Check if no ICP field is set (a field scan, no model_dump)."""
+        return all(getattr(self, f) is None for f in _ICP_FIELDS)
+
 
-class PromptConfig(BaseModel):
+class PromptConfig(_SchemaCachedModel):
     """
     Deployment-specific prompt configuration.
 
     All fields are optional - only configured fields will be added to the prompt.
+    Frozen: PromptManager caches prompts per config, so swap in a new config
+    (update_config) instead of editing one.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Company/service description
     company_name: str | None = Field(
         default=None,
@@ -70,7 +124,7 @@ class PromptConfig(BaseModel):
     )
 
     # Custom qualifying questions
-    qualifying_questions: list[str] | None = Field(
+    qualifying_questions: tuple[str, ...] | None = Field(
         default=None,
         description="Questions to consider when evaluating leads",
         examples=[
@@ -89,27 +143,145 @@ class PromptConfig(BaseModel):
     )
 
     # Research-specific configuration
-    research_focus_areas: list[str] | None = Field(
+    research_focus_areas: tuple[str, ...] | None = Field(
         default=None,
         description="Specific areas to focus on during lead research",
         examples=[["Technical stack", "Recent funding", "Team size", "Current challenges"]],
     )
 
+    # Opt-in rule-based prefilter (off by default: some deployments sell exactly these services)
+    spam_rules: tuple[Literal["seo", "crypto"], ...] | None = Field(
+        default=None,
+        description="Built-in spam rules that mark matching leads 'ignore' without an LLM call",
+        examples=[["seo", "crypto"]],
+    )
+
     def is_empty(self) -> bool:
         """Check if configuration has any values set."""
-        return all(
-            v is None
-            for v in [
-                self.company_name,
-                self.services_description,
-                self.icp,
-                self.qualifying_questions,
-                self.custom_instructions,
-                self.research_focus_areas,
-            ]
+        return (
+            self.company_name is None
+            and self.services_description is None
+            and self.icp is None
+            and self.qualifying_questions is None
+            and self.custom_instructions is None
+            and self.research_focus_areas is None
+            and self.spam_rules is None
         )
 
 
+# Shared default for every no-config path (frozen, so safe to share; nothing to validate)
+_EMPTY_CONFIG = PromptConfig.model_construct()
+
+
+def _memoized(method):
+    """Cache a prompt (or prompt fragment) on the manager until its config changes."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: "PromptManager", *args: str):
+        key = (name, *args)
+        try:
+            return self._prompt_cache[key]
+        except KeyError:
+            value = self._prompt_cache[key] = method(self, *args)
+            return value
+
+    return wrapper
+
+
+# ICP lines per prompt style: (field, label). Classification/triage describe the target;
+# scoring/research weigh fit, so they skip geography and call disqualifiers red flags.
+_ICP_LABELS = {
+    "classification": (
+        ("description", "Target Profile"),
+        ("target_industries", "Target Industries"),
+        ("target_company_sizes", "Target Company Sizes"),
+        ("target_roles", "Decision Maker Roles"),
+        ("geographic_focus", "Geographic Focus"),
+        ("disqualifying_signals", "Disqualifying Signals"),
+    ),
+    "scoring": (
+        ("description", "Ideal Profile"),
+        ("target_industries", "Priority Industries"),
+        ("target_company_sizes", "Target Company Sizes"),
+        ("target_roles", "Decision Maker Roles"),
+        ("disqualifying_signals", "Red Flags"),
+    ),
+}
+
+# Search-operator clauses derived from ICP list fields: (field, clause label)
+_ICP_CLAUSES = (
+    ("target_industries", "Industry clause"),
+    ("target_roles", "Role/title clause"),
+    ("geographic_focus", "Geo clause"),
+    ("target_company_sizes", "Company size clause"),
+)
+
+
+def _or_quote(values: Iterable[str]) -> str:
+    """Quoted search terms OR'ed together: '"a" OR "b"'."""
+    return " OR ".join(['"' + x + '"' for x in values])
+
+
+@dataclass(frozen=True, slots=True)
+class _PromptSpec:
+    """How a prompt is assembled: a base prompt plus (section, header) pairs, in order."""
+
+    base: str
+    sections: tuple[tuple[str, str], ...]
+
+
+_COMPANY_HEADER = "\n--- Internal Company Context ---\n"
+_ICP_HEADER = "\n--- Ideal Client Profile ---\n"
+_INSTRUCTIONS_HEADER = "\n--- Additional Instructions ---\n"
+_CLAUSE_PACK_HEADER = (
+    "\n--- Query Operator Clause Pack (use in DuckDuckGo queries) ---\n"
+    "Use these to make searches specific. Combine with quoted company/contact names and site: constraints when useful:\n"
+)
+
+# Sections name PromptManager._<block>_block methods (see PromptManager._section); a
+# section is skipped when the config has nothing for it.
+_SPECS: dict[str, _PromptSpec] = {
+    "classification": _PromptSpec(
+        BASE_SYSTEM_PROMPT,
+        (
+            ("company_context", _COMPANY_HEADER),
+            ("icp:classification", _ICP_HEADER),
+            ("questions", "\n--- Qualifying Questions ---\nConsider these when classifying:\n"),
+            ("additional_instructions", _INSTRUCTIONS_HEADER),
+        ),
+    ),
+    # Same sections as classification, but with a triage-focused base prompt
+    "triage": _PromptSpec(
+        BASE_TRIAGE_PROMPT,
+        (
+            ("company_context", _COMPANY_HEADER),
+            ("icp:classification", _ICP_HEADER),
+            ("questions", "\n--- Qualifying Questions ---\nConsider these during triage:\n"),
+            ("additional_instructions", _INSTRUCTIONS_HEADER),
+        ),
+    ),
+    # ICP context so scoring can incorporate fit; questions matter for prioritization
+    "scoring": _PromptSpec(
+        BASE_SCORING_PROMPT,
+        (
+            ("icp:scoring", _ICP_HEADER),
+            ("questions", "\n--- Qualifying Questions ---\nUse these to justify score/action:\n"),
+        ),
+    ),
+    # What to gather, what we're trying to determine, what makes a lead valuable to us
+    "research": _PromptSpec(
+        BASE_RESEARCH_PROMPT,
+        (
+            ("focus_areas", "\n--- What to Research ---\nFocus on finding:\n"),
+            ("questions", "\n--- Questions to Answer ---\nTry to gather information that helps answer:\n"),
+            ("icp:scoring", _ICP_HEADER + "Use this context to assess fit:\n"),
+            ("clause_pack", _CLAUSE_PACK_HEADER),
+        ),
+    ),
+}
+
+
 class PromptManager:
     """
     Manages prompt configuration and builds dynamic prompts.
@@ -119,26 +291,96 @@ class PromptManager:
     2. Environment variable PROMPT_CONFIG_JSON
     3. Config file (prompt_config.json in project root)
     4. Defaults (empty configuration)
+
+    Built prompts and their shared sections are cached until update_config()/
+    reset_config(), so configs should be replaced rather than mutated in place.
     """
 
     def __init__(self, config: PromptConfig | None = None):
-        self._config = config or PromptConfig()
-        self._runtime_config: PromptConfig | None = None
+        self._config = config or _EMPTY_CONFIG
+        # Effective config: the runtime override if set, else the base config
+        self._effective = self._config
+        self._prompt_cache: dict[tuple[str, ...], str | None] = {}
 
     @property
     def config(self) -> PromptConfig:
         """Get the effective configuration (runtime overrides base)."""
-        if self._runtime_config is not None:
-            return self._runtime_config
-        return self._config
+        return self._effective
 
     def update_config(self, config: PromptConfig) -> None:
         """Update runtime configuration."""
-        self._runtime_config = config
+        self._effective = config
+        self._prompt_cache.clear()
 
     def reset_config(self) -> None:
         """Reset to base configuration (clear runtime overrides)."""
-        self._runtime_config = None
+        self._effective = self._config
+        self._prompt_cache.clear()
+
+    # --- Shared prompt section bodies (headers live in _SPECS; None when the config has nothing for them) ---
+
+    @_memoized
+    def _company_context_block(self) -> str | None:
+        cfg = self.config
+        context_parts = []
+        if cfg.company_name:
+            context_parts.append(f"Company: {cfg.company_name}")
+        if cfg.services_description:
+            context_parts.append(f"Services: {cfg.services_description}")
+        return "\n".join(context_parts) or None
+
+    @_memoized
+    def _icp_value(self, field: str) -> str | None:
+        """One ICP field as display text (lists comma-joined), shared by every ICP style."""
+        value = getattr(self.config.icp, field, None)
+        if not value:
+            return None
+        return value if isinstance(value, str) else ", ".join(value)
+
+    @_memoized
+    def _icp_block(self, style: str) -> str | None:
+        icp_parts = []
+        for field, label in _ICP_LABELS[style]:
+            value = self._icp_value(field)
+            if value:
+                icp_parts.append(f"**{label}:** {value}")
+        return "\n".join(icp_parts) or None
+
+    @_memoized
+    def _questions_block(self) -> str | None:
+        questions = self.config.qualifying_questions
+        return "\n".join(["- " + q for q in questions]) if questions else None
+
+    @_memoized
+    def _focus_areas_block(self) -> str | None:
+        areas = self.config.research_focus_areas
+        return "\n".join(["- " + area for area in areas]) if areas else None
+
+    def _additional_instructions_block(self) -> str | None:
+        return self.config.custom_instructions or None
+
+    @staticmethod
+    def _join(*parts: str | None) -> str:
+        return "\n".join(part for part in parts if part)
+
+    def _section(self, name: str) -> str | None:
+        """Body of one spec section: "<block>" or "<block>:<arg>" naming a _<block>_block method."""
+        block, _, arg = name.partition(":")
+        method = getattr(self, f"_{block}_block")
+        return method(arg) if arg else method()
+
+    # --- Prompt builders ---
+
+    @_memoized
+    def _build(self, kind: str) -> str:
+        """Assemble a prompt from its spec: base prompt, then each non-empty section under its header."""
+        spec = _SPECS[kind]
+        sections = []
+        for name, header in spec.sections:
+            body = self._section(name)
+            if body:
+                sections.append(header + body)
+        return self._join(spec.base, *sections)
 
     def build_classification_prompt(self) -> str:
         """
@@ -146,54 +388,7 @@ class PromptManager:
 
         Combines base prompt with deployment-specific configuration.
         """
-        parts = [BASE_SYSTEM_PROMPT]
-        cfg = self.config
-
-        # Add company context
-        if cfg.company_name or cfg.services_description:
-            context_parts = []
-            if cfg.company_name:
-                context_parts.append(f"Company: {cfg.company_name}")
-            if cfg.services_description:
-                context_parts.append(f"Services: {cfg.services_description}")
-            parts.append("\n--- Internal Company Context ---\n" + "\n".join(context_parts))
-
-        # Add ICP criteria
-        if cfg.icp and not cfg.icp.model_dump(exclude_none=True) == {}:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Target Profile:** {icp.description}")
-
-            if icp.target_industries:
-                icp_parts.append(f"**Target Industries:** {', '.join(icp.target_industries)}")
-
-            if icp.target_company_sizes:
-                icp_parts.append(f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}")
-
-            if icp.target_roles:
-                icp_parts.append(f"**Decision Maker Roles:** {', '.join(icp.target_roles)}")
-
-            if icp.geographic_focus:
-                icp_parts.append(f"**Geographic Focus:** {', '.join(icp.geographic_focus)}")
-
-            if icp.disqualifying_signals:
-                icp_parts.append(f"**Disqualifying Signals:** {', '.join(icp.disqualifying_signals)}")
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
-
-        # Add qualifying questions
-        if cfg.qualifying_questions:
-            questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(f"\n--- Qualifying Questions ---\nConsider these when classifying:\n{questions}")
-
-        # Add custom instructions
-        if cfg.custom_instructions:
-            parts.append(f"\n--- Additional Instructions ---\n{cfg.custom_instructions}")
-
-        return "\n".join(parts)
+        return self._build("classification")
 
     def build_triage_prompt(self) -> str:
         """
@@ -201,82 +396,11 @@ class PromptManager:
 
         Uses the same deployment-specific config as classification, but tuned for speed.
         """
-        # Reuse the classification prompt sections (company context, ICP, questions, etc.),
-        # but with a triage-focused base prompt.
-        parts = [BASE_TRIAGE_PROMPT]
-        cfg = self.config
-
-        # Add company context
-        if cfg.company_name or cfg.services_description:
-            context_parts = []
-            if cfg.company_name:
-                context_parts.append(f"Company: {cfg.company_name}")
-            if cfg.services_description:
-                context_parts.append(f"Services: {cfg.services_description}")
-            parts.append("\n--- Internal Company Context ---\n" + "\n".join(context_parts))
-
-        # Add ICP criteria
-        if cfg.icp and not cfg.icp.model_dump(exclude_none=True) == {}:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Target Profile:** {icp.description}")
-            if icp.target_industries:
-                icp_parts.append(f"**Target Industries:** {', '.join(icp.target_industries)}")
-            if icp.target_company_sizes:
-                icp_parts.append(f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}")
-            if icp.target_roles:
-                icp_parts.append(f"**Decision Maker Roles:** {', '.join(icp.target_roles)}")
-            if icp.geographic_focus:
-                icp_parts.append(f"**Geographic Focus:** {', '.join(icp.geographic_focus)}")
-            if icp.disqualifying_signals:
-                icp_parts.append(f"**Disqualifying Signals:** {', '.join(icp.disqualifying_signals)}")
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
-
-        # Add qualifying questions
-        if cfg.qualifying_questions:
-            questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(f"\n--- Qualifying Questions ---\nConsider these during triage:\n{questions}")
-
-        # Add custom instructions
-        if cfg.custom_instructions:
-            parts.append(f"\n--- Additional Instructions ---\n{cfg.custom_instructions}")
-
-        return "\n".join(parts)
+        return self._build("triage")
 
     def build_scoring_prompt(self) -> str:
         """Build scoring system prompt."""
-        parts = [BASE_SCORING_PROMPT]
-        cfg = self.config
-
-        # Add ICP context so scoring can incorporate fit.
-        if cfg.icp:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Ideal Profile:** {icp.description}")
-            if icp.target_industries:
-                icp_parts.append(f"**Priority Industries:** {', '.join(icp.target_industries)}")
-            if icp.target_company_sizes:
-                icp_parts.append(f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}")
-            if icp.target_roles:
-                icp_parts.append(f"**Decision Maker Roles:** {', '.join(icp.target_roles)}")
-            if icp.disqualifying_signals:
-                icp_parts.append(f"**Red Flags:** {', '.join(icp.disqualifying_signals)}")
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
-
-        # Add qualifying questions (what matters for prioritization)
-        if cfg.qualifying_questions:
-            questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(f"\n--- Qualifying Questions ---\nUse these to justify score/action:\n{questions}")
-
-        return "\n".join(parts)
+        return self._build("scoring")
 
     def build_research_prompt(self) -> str:
         """
@@ -284,86 +408,59 @@ class PromptManager:
 
         Combines base research prompt with deployment-specific focus areas.
         """
-        parts = [BASE_RESEARCH_PROMPT]
-        cfg = self.config
+        return self._build("research")
 
-        # Add research focus areas - what specific information to gather
-        if cfg.research_focus_areas:
-            areas = "\n".join(f"- {area}" for area in cfg.research_focus_areas)
-            parts.append(f"\n--- What to Research ---\nFocus on finding:\n{areas}")
-
-        # Add qualifying questions - what we're trying to determine
-        if cfg.qualifying_questions:
-            questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(f"\n--- Questions to Answer ---\nTry to gather information that helps answer:\n{questions}")
+    def _clause_pack_block(self) -> str:
+        """Concrete search-operator clauses derived from prompt_config, to improve query quality."""
+        cfg = self.config
+        buf = StringIO()
+        write = buf.write
+        write("- General noise filters: -jobs -careers -hiring -pdf -login")
 
-        # Add ICP context - what makes a lead valuable to us
         if cfg.icp:
             icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Ideal Profile:** {icp.description}")
+            for field, label in _ICP_CLAUSES:
+                values = getattr(icp, field)
+                if values:
+                    write(f"\n- {label}: (")
+                    write(_or_quote(values))
+                    write(")")
+            if icp.disqualifying_signals:
+                # Treat as exclusions the model can optionally apply to avoid junk
+                write("\n- Disqualifier exclusions (optional): ")
+                write(" ".join(['-"' + x + '"' for x in icp.disqualifying_signals]))
 
-            if icp.target_industries:
-                icp_parts.append(f"**Priority Industries:** {', '.join(icp.target_industries)}")
+        if cfg.research_focus_areas:
+            write("\n- Focus-area terms (optional): (")
+            write(_or_quote(cfg.research_focus_areas))
+            write(")")
 
-            if icp.target_company_sizes:
-                icp_parts.append(f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}")
+        if cfg.qualifying_questions:
+            write(
+                "\n- Qualifying questions: convert 1–2 into query clauses (e.g., pricing/budget, SOC2/compliance, headcount/employees)."
+            )
 
-            if icp.target_roles:
-                icp_parts.append(f"**Decision Maker Roles:** {', '.join(icp.target_roles)}")
+        return buf.getvalue()
 
-            if icp.disqualifying_signals:
-                icp_parts.append(f"**Red Flags:** {', '.join(icp.disqualifying_signals)}")
 
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\nUse this context to assess fit:\n" + "\n".join(icp_parts))
+# Default prompt config locations, relative to the working directory
+_DEFAULT_CONFIG_CANDIDATES: tuple[Path, ...] = (Path("prompt_config.json"), Path("config/prompt_config.json"))
 
-        # Add a concrete operator clause pack derived from prompt_config to improve query quality
-        clause_pack_lines: list[str] = []
-        clause_pack_lines.append("General noise filters: -jobs -careers -hiring -pdf -login")
+# Loaded prompt configs: (path, validate) -> (file mtime_ns, config)
+_config_cache: dict[tuple[Path, bool], tuple[int, PromptConfig]] = {}
 
-        if cfg.icp:
-            icp = cfg.icp
-            if icp.target_industries:
-                industries = " OR ".join(f"\"{x}\"" for x in icp.target_industries)
-                clause_pack_lines.append(f"Industry clause: ({industries})")
-            if icp.target_roles:
-                roles = " OR ".join(f"\"{x}\"" for x in icp.target_roles)
-                clause_pack_lines.append(f"Role/title clause: ({roles})")
-            if icp.geographic_focus:
-                geos = " OR ".join(f"\"{x}\"" for x in icp.geographic_focus)
-                clause_pack_lines.append(f"Geo clause: ({geos})")
-            if icp.target_company_sizes:
-                sizes = " OR ".join(f"\"{x}\"" for x in icp.target_company_sizes)
-                clause_pack_lines.append(f"Company size clause: ({sizes})")
-            if icp.disqualifying_signals:
-                # Treat as exclusions the model can optionally apply to avoid junk
-                exclusions = " ".join(f"-\"{x}\"" for x in icp.disqualifying_signals)
-                clause_pack_lines.append(f"Disqualifier exclusions (optional): {exclusions}")
 
-        if cfg.research_focus_areas:
-            focus = " OR ".join(f"\"{x}\"" for x in cfg.research_focus_areas)
-            clause_pack_lines.append(f"Focus-area terms (optional): ({focus})")
+def _tupled(data: dict) -> dict:
+    """JSON lists as tuples, matching what validation would produce for the tuple fields."""
+    return {k: tuple(v) if isinstance(v, list) else v for k, v in data.items()}
 
-        if cfg.qualifying_questions:
-            clause_pack_lines.append(
-                "Qualifying questions: convert 1–2 into query clauses (e.g., pricing/budget, SOC2/compliance, headcount/employees)."
-            )
-
-        if clause_pack_lines:
-            clause_pack = "\n".join(f"- {line}" for line in clause_pack_lines)
-            parts.append(
-                "\n--- Query Operator Clause Pack (use in DuckDuckGo queries) ---\n"
-                "Use these to make searches specific. Combine with quoted company/contact names and site: constraints when useful:\n"
-                f"{clause_pack}"
-            )
 
-        return "\n".join(parts)
+def _first_existing(candidates: Iterable[Path]) -> Path | None:
+    """First candidate that is an existing file, or None."""
+    return next((p for p in candidates if p.is_file()), None)
 
 
-def load_prompt_config_from_file(path: Path | str | None = None) -> PromptConfig:
+def load_prompt_config_from_file(path: Path | str | None = None, *, validate: bool | None = None) -> PromptConfig:
     """
     Load prompt configuration from JSON file.
 
@@ -372,42 +469,49 @@ def load_prompt_config_from_file(path: Path | str | None = None) -> PromptConfig
               1. PROMPT_CONFIG_PATH environment variable
               2. prompt_config.json in current directory
               3. config/prompt_config.json
+        validate: Run pydantic validation on the file contents. Defaults to True
+              unless LEADS_AGENT_SKIP_VALIDATION=1, in which case the (trusted,
+              deploy-time) file is loaded with model_construct.
     """
-    import os
-
-    if path is None:
-        # Check environment variable first
-        env_path = os.environ.get("PROMPT_CONFIG_PATH")
-        if env_path:
-            path = Path(env_path)
-            if not path.is_file():
-                print(f"[WARN] PROMPT_CONFIG_PATH set but file not found: {env_path}")
-                return PromptConfig()
-        else:
-            # Search for config file in default locations
-            candidates = [
-                Path("prompt_config.json"),
-                Path("config/prompt_config.json"),
-                Path.cwd() / "prompt_config.json",
-            ]
-            for candidate in candidates:
-                if candidate.is_file():
-                    path = candidate
-                    break
-
-    if path is None:
-        return PromptConfig()
-
-    path = Path(path)
-    if not path.is_file():
-        return PromptConfig()
+    if validate is None:
+        validate = os.environ.get("LEADS_AGENT_SKIP_VALIDATION") != "1"
+
+    # Resolve the file with exactly one is_file() check per candidate
+    if path is not None:
+        path = path if isinstance(path, Path) else Path(path)
+        if not path.is_file():
+            return _EMPTY_CONFIG
+    elif env_path := os.environ.get("PROMPT_CONFIG_PATH"):
+        # Environment variable takes precedence over the default locations
+        path = Path(env_path)
+        if not path.is_file():
+            logger.warning("PROMPT_CONFIG_PATH set but file not found: %s", env_path)
+            return _EMPTY_CONFIG
+    else:
+        path = _first_existing(_DEFAULT_CONFIG_CANDIDATES)
+        if path is None:
+            return _EMPTY_CONFIG
 
     try:
-        data = json.loads(path.read_text())
-        return PromptConfig.model_validate(data)
-    except (json.JSONDecodeError, ValueError) as e:
-        print(f"[WARN] Failed to load prompt config from {path}: {e}")
-        return PromptConfig()
+        # Reuse the parsed config while the file is unchanged (configs are frozen, so sharing is safe)
+        mtime = path.stat().st_mtime_ns
+        key = (path, validate)
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = _json_loads(path.read_bytes())
+        if validate:
+            config = PromptConfig.model_validate(data)
+        else:
+            icp = data.get("icp")
+            config = PromptConfig.model_construct(
+                **{**_tupled(data), "icp": ICPConfig.model_construct(**_tupled(icp)) if icp else None}
+            )
+        _config_cache[key] = (mtime, config)
+        return config
+    except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("Failed to load prompt config from %s: %s", path, e)
+        return _EMPTY_CONFIG
 
 
 def load_prompt_config() -> PromptConfig:
@@ -424,21 +528,14 @@ def load_prompt_config() -> PromptConfig:
 
 
 # Global prompt manager instance
-_prompt_manager: PromptManager | None = None
-
-
+@lru_cache(maxsize=1)
 def get_prompt_manager() -> PromptManager:
     """Get or create the global prompt manager."""
-    global _prompt_manager
-    if _prompt_manager is None:
-        config = load_prompt_config()
-        _prompt_manager = PromptManager(config)
-    return _prompt_manager
+    return PromptManager(load_prompt_config())
 
 
 def reset_prompt_manager() -> None:
     """Reset the global prompt manager (useful for testing)."""
-    global _prompt_manager
-    _prompt_manager = None
+    get_prompt_manager.cache_clear()
 
 
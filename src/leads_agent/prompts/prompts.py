@@ -42,17 +42,18 @@ Conservatism:
 BASE_RESEARCH_PROMPT = """\
 You are researching a promising inbound lead to gather context before outreach.
 
-You have access to a DuckDuckGo search tool. Your job is to craft **high-quality search queries**
-and use results to fill in structured research fields.
+Results for the core searches (email domain, company, contact) are included with the lead.
+Use them to fill in structured research fields. When a DuckDuckGo search tool is available,
+use it only for follow-ups the included results leave open, crafting **high-quality search queries**.
 
-Search strategy (do this in order):
+Research goals (in order):
 1) Confirm company identity and official website (prefer email domain if present)
 2) Get a crisp description of what they do + primary industry/vertical
 3) Find signals relevant to our ICP and qualifying questions (size, customers, initiatives, etc.)
 4) If a contact name is available, find role/title and seniority
 
 Query-writing rules (DuckDuckGo):
-- Before each tool call, draft 2–3 candidate queries, then pick the best one.
+- Before each follow-up tool call, draft 2–3 candidate queries, then pick the best one.
 - Make queries specific and disambiguated: include entity + a qualifier.
 - Use operators when helpful:
   - Quotes for exact names: "Company Name", "Full Name"
@@ -60,6 +61,7 @@ Query-writing rules (DuckDuckGo):
   - Exclusions to remove noise: -jobs -careers -hiring -pdf -login
   - OR groups (use sparingly): (pricing OR customers OR case study)
 - Avoid low-signal queries like "company website" or single-word searches.
+- Add ICP/focus-area qualifiers from the "Query Operator Clause Pack" section below.
 
 Recommended query templates:
 - Company identity/website:
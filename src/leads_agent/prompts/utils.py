@@ -1,18 +1,18 @@
-from rich import print as rprint
-from rich.panel import Panel
-from rich.syntax import Syntax
-import json
-
 from leads_agent.prompts.manager import get_prompt_manager
 from leads_agent.config import _find_prompt_config_source
 
 def display_prompts(show_full: bool = False, as_json: bool = False):
+    # Imported here so importing leads_agent.prompts doesn't pull in rich.syntax (and pygments)
+    from rich import print as rprint
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     manager = get_prompt_manager()
     config = manager.config
 
     if as_json:
         # Output raw JSON for scripting
-        rprint(json.dumps(config.model_dump(exclude_none=True), indent=2))
+        rprint(config.model_dump_json(exclude_none=True, indent=2))
         return
 
     rprint(Panel.fit("📝 [bold cyan]Prompt Configuration[/]", border_style="cyan"))
@@ -79,6 +79,10 @@ def display_prompts(show_full: bool = False, as_json: bool = False):
         for area in config.research_focus_areas:
             rprint(f"  • {area}")
 
+    # Spam rules
+    if config.spam_rules:
+        rprint(f"\n[bold]Spam Rules:[/] {', '.join(config.spam_rules)}")
+
     # Show full prompts if requested
     if show_full:
         rprint("\n" + "─" * 60)
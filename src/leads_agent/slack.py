@@ -2,6 +2,14 @@ from slack_sdk import WebClient
 
 from leads_agent.config import Settings
 
+# Hints shown next to common conversations_history errors
+SLACK_ERROR_HINTS = {
+    "not_in_channel": "The bot must be invited to the channel. Use /invite @bot-name in Slack.",
+    "channel_not_found": "Check that the channel ID is correct.",
+    "missing_scope": "The bot token needs 'channels:history' (public) or 'groups:history' (private) scope.",
+    "invalid_auth": "The SLACK_BOT_TOKEN is invalid or expired.",
+}
+
 
 def slack_client(settings: Settings) -> WebClient:
     """Create a Slack WebClient instance."""